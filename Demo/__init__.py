@@ -1 +1,3 @@
-print("Welcome to my MonteCarlo Final Project")
+"""
+MonteCarlo simulator: the Die, Game and Analyzer classes live in Demo.montecarlo.
+"""
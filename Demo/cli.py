@@ -0,0 +1,187 @@
+"""
+Command-line simulation runner for batch jobs.
+
+Builds dice from faces and weights (or a weights file with one 'face weight' pair per line, like
+data/english_letters.txt), plays the game, and streams the chosen Analyzer statistics to stdout as CSV or to
+columnar files. Timing and throughput go to stderr so stdout stays clean for the results.
+
+Usage:
+    montecarlo --rolls 1000000 --dice 3 --stats jackpot combo_faces
+    montecarlo --weights-file data/english_letters.txt --dice 4 --rolls 100000 --stats distinct_permutations
+    montecarlo --faces H T --weights 3 1 --rolls 10000000 --chunk-size 1000000 --output results/
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from .montecarlo import Die, Game, Analyzer, _BLOCK_ROLLS
+
+STATS = ['jackpot', 'rolled_event', 'combo_faces', 'distinct_permutations']
+
+
+def _faces(values):
+    """
+    Faces as given on the command line or in a weights file: integers if they all are, strings otherwise.
+    """
+    try:
+        return np.array([int(value) for value in values])
+    except ValueError:
+        return np.array(values)
+
+
+def _read_weights(path):
+    """
+    Reads a weights file, one 'face weight' pair per line.
+
+    Returns:
+    - Returns the faces (np.array) and their weights (list of floats).
+    """
+    with open(path) as file:
+        pairs = [line.split() for line in file if line.strip()]
+    return _faces([face for face, _ in pairs]), [float(weight) for _, weight in pairs]
+
+
+def build_game(args):
+    """
+    Builds the game described by the parsed arguments, every die sharing one face and weight spec.
+
+    Args:
+    - args (argparse.Namespace): parsed command-line arguments.
+
+    Returns:
+    - Returns the Game.
+
+    Raises:
+    - ValueError: if the weights do not match the faces.
+    """
+    if args.weights_file:
+        faces, weights = _read_weights(args.weights_file)
+    else:
+        faces, weights = _faces(args.faces), args.weights
+    die = Die(faces)
+    if weights is not None:
+        die.set_weights(weights)
+    return Game([die] * args.dice, seed=args.seed)
+
+
+def _emit(name, result, args):
+    """
+    Writes one statistic to stdout as CSV, or to a columnar file named after it in the output directory.
+    """
+    import pandas as pd
+
+    ##the jackpot count becomes a one-row frame
+    indexed = isinstance(result, pd.DataFrame)
+    frame = result if indexed else pd.DataFrame({name: [result]})
+    if args.output:
+        from . import columnar
+
+        os.makedirs(args.output, exist_ok=True)
+        columnar.write_frame(frame, os.path.join(args.output, f'{name}.{args.format}'))
+    else:
+        print(f'# {name}')
+        frame.to_csv(sys.stdout, index=indexed)
+
+
+def run(args):
+    """
+    Plays the game and emits the statistics.
+
+    Without a chunk size the game is played in one go, across a process pool of one worker per CPU unless told otherwise,
+    and the statistics are computed on the stored results. With a chunk size the rolls are streamed through the one
+    statistic asked for, or a single-pass Analyzer.summary for several, so memory stays bounded by the chunk;
+    rolled_event is then the count histogram.
+
+    Args:
+    - args (argparse.Namespace): parsed command-line arguments.
+
+    Returns:
+    - Returns a dict of timings: total seconds, play seconds (None when streamed, as play and analysis interleave)
+      and rolls per second.
+    """
+    game = build_game(args)
+    analyzer = Analyzer(game, threads=args.threads)
+    started = time.perf_counter()
+    if args.chunk_size:
+        chunks = game.play_stream(args.rolls, chunk_size=args.chunk_size, seed=args.seed)
+        play_seconds = None
+        if len(args.stats) == 1:
+            results = {args.stats[0]: getattr(analyzer, args.stats[0])(chunks=chunks)}
+        else:
+            results = analyzer.summary(chunks=chunks)
+            results = {name: results[name] for name in args.stats}
+    else:
+        workers = args.workers if args.workers is not None else os.cpu_count()
+        game.play(args.rolls, seed=args.seed, workers=workers)
+        play_seconds = time.perf_counter() - started
+        results = {name: getattr(analyzer, name)() for name in args.stats}
+    seconds = time.perf_counter() - started
+    for name, result in results.items():
+        _emit(name, result, args)
+    return {
+        'seconds': seconds,
+        'play_seconds': play_seconds,
+        'rolls_per_second': args.rolls / seconds if seconds else float('inf'),
+    }
+
+
+def parser():
+    """
+    The command-line argument parser.
+    """
+    parse = argparse.ArgumentParser(prog='montecarlo', description=__doc__,
+                                    formatter_class=argparse.RawDescriptionHelpFormatter)
+    spec = parse.add_mutually_exclusive_group()
+    spec.add_argument('--faces', nargs='+', default=[str(face) for face in range(1, 7)],
+                      help='faces of the die; defaults to 1 to 6')
+    spec.add_argument('--weights-file', help="file of 'face weight' lines, e.g. data/english_letters.txt")
+    parse.add_argument('--weights', nargs='+', type=float, help='one weight per face; defaults to a fair die')
+    parse.add_argument('--dice', type=int, default=2, help='number of dice; defaults to 2')
+    parse.add_argument('--rolls', type=int, required=True, help='number of rolls')
+    parse.add_argument('--seed', type=int, help='seed of the play, for reproducible runs')
+    parse.add_argument('--workers', type=int, help='worker processes for the play; defaults to one per CPU')
+    parse.add_argument('--threads', type=int, help='threads the statistics are computed with; defaults to one')
+    parse.add_argument('--chunk-size', type=int,
+                       help=f'stream the play in chunks of this many rolls instead of storing it, e.g. {_BLOCK_ROLLS}')
+    parse.add_argument('--stats', nargs='+', choices=STATS, default=['jackpot'], help='statistics to report')
+    parse.add_argument('--output', help='directory to write one columnar file per statistic to, instead of stdout')
+    parse.add_argument('--format', choices=['parquet', 'arrow'], default='parquet', help='columnar file format')
+    return parse
+
+
+def main(argv=None):
+    """
+    Entry point of the montecarlo console script.
+
+    Args:
+    - argv (list, optional): command-line arguments; defaults to sys.argv.
+
+    Returns:
+    - Returns the exit code.
+    """
+    parse = parser()
+    args = parse.parse_args(argv)
+    if args.weights is not None and args.weights_file:
+        parse.error('give --weights or --weights-file, not both')
+    if args.rolls < 0 or args.dice < 1:
+        parse.error('--rolls must be at least 0 and --dice at least 1')
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parse.error('--chunk-size must be at least 1')
+    try:
+        timings = run(args)
+    except (ValueError, OSError) as error:
+        parse.error(str(error))
+    if timings['play_seconds'] is None:
+        split = 'streamed'
+    else:
+        split = f"play {timings['play_seconds']:.3f}s, analysis {timings['seconds'] - timings['play_seconds']:.3f}s"
+    print(f"{args.rolls} rolls of {args.dice} dice in {timings['seconds']:.3f}s ({split}), "
+          f"{timings['rolls_per_second']:.4g} rolls/s", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
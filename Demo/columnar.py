@@ -0,0 +1,243 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from .montecarlo import Die
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+##schema metadata key of the original column labels written by write_frame
+_COLUMNS_KEY = b'montecarlo.columns'
+
+
+def _require():
+    """
+    Raises an ImportError if pyarrow is not installed.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is needed for columnar files, install it with pip install -e .[arrow]!!")
+
+
+def _is_parquet(path):
+    """
+    True if path names a Parquet file, otherwise it is treated as an Arrow IPC file.
+    """
+    return str(path).endswith('.parquet')
+
+
+class _Writer:
+    """
+    Writes record batches to a Parquet file (one row group per batch) or an Arrow IPC file, chosen by the path's extension.
+    """
+    def __init__(self, path, schema):
+        if _is_parquet(path):
+            self._writer = pq.ParquetWriter(path, schema)
+        else:
+            self._writer = ipc.new_file(path, schema)
+
+    def write(self, batch):
+        if isinstance(self._writer, pq.ParquetWriter):
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+
+
+def _plain(column):
+    """
+    Turns a dictionary-encoded (categorical) column back into a column of its faces.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.astype(column.cat.categories.dtype)
+    return column
+
+
+def _batches(path):
+    """
+    Reads a Parquet or Arrow IPC file lazily, one record batch at a time.
+    """
+    if _is_parquet(path):
+        yield from pq.ParquetFile(path).iter_batches()
+    else:
+        reader = ipc.open_file(path)
+        for idx in range(reader.num_record_batches):
+            yield reader.get_batch(idx)
+
+
+##write play results
+def write_results(game, path, chunks=None):
+    """
+    Writes play results with one dictionary-encoded column per die, the dictionary being the game's face lookup.
+
+    The file is a Parquet file if path ends in .parquet, otherwise an Arrow IPC file.
+    Each chunk becomes its own row group (or record batch), so a chunked play is written as it runs.
+
+    Args:
+    - game (Game): game whose results are written.
+    - path (str): file to write.
+    - chunks (iterable, optional): integer-code chunks from Game.play_stream to write instead of the stored play.
+
+    Raises:
+    - ValueError: if there is nothing to write.
+    """
+    _require()
+    if chunks is None:
+        if game._data is None:
+            raise ValueError("Game has not been played!!")
+        chunks = [game._data]
+        faces = pa.array(game._faces)
+    else:
+        ##streamed chunks index the dice's current face lookup
+        faces = pa.array(game._face_lookup()[0])
+    names = [f'die_{idx}' for idx in range(len(game.dies))]
+    writer = None
+    start = 0
+    for codes in chunks:
+        columns = [pa.array(np.arange(start, start + len(codes)))]
+        columns += [pa.DictionaryArray.from_arrays(pa.array(codes[:, idx]), faces) for idx in range(codes.shape[1])]
+        batch = pa.RecordBatch.from_arrays(columns, names=['roll'] + names)
+        if writer is None:
+            writer = _Writer(path, batch.schema)
+        writer.write(batch)
+        start += len(codes)
+    if writer is None:
+        raise ValueError("No rolls to write!!")
+    writer.close()
+
+
+##read play results back lazily
+def read_results(path):
+    """
+    Reads play results written by write_results, one batch at a time.
+
+    Args:
+    - path (str): Parquet or Arrow IPC file.
+
+    Returns:
+    - Returns a generator of wide data frames indexed by roll number, as play_results would return them.
+    """
+    _require()
+    for batch in _batches(path):
+        frame = batch.to_pandas()
+        frame = frame.set_index('roll')
+        frame.index.name = None
+        yield frame.apply(_plain)
+
+
+def read_chunks(path):
+    """
+    Reads play results written by write_results as integer-code chunks, straight from the dictionary indices.
+
+    The chunks can be passed to any Analyzer method's chunks argument for a game with the same face lookup.
+
+    Args:
+    - path (str): Parquet or Arrow IPC file.
+
+    Returns:
+    - Returns a generator of integer-code arrays of shape (chunk rolls, number of dice).
+    """
+    _require()
+    for batch in _batches(path):
+        columns = [column.indices.to_numpy() for column in batch.columns[1:]]
+        yield np.column_stack(columns)
+
+
+##die configurations
+def write_dice(dies, path):
+    """
+    Writes the faces and weights of a list of dice, one row per face, with a dictionary-encoded face column.
+
+    Args:
+    - dies (list): dice to write.
+    - path (str): Parquet or Arrow IPC file.
+    """
+    _require()
+    states = [die.current_state() for die in dies]
+    frame = pd.DataFrame({
+        'die': np.repeat(np.arange(len(states)), [len(state) for state in states]),
+        'face': np.concatenate([state.index.to_numpy() for state in states]),
+        'weights': np.concatenate([state['weights'].to_numpy() for state in states]),
+    })
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.set_column(1, 'face', table.column('face').dictionary_encode())
+    writer = _Writer(path, table.schema)
+    for batch in table.to_batches():
+        writer.write(batch)
+    writer.close()
+
+
+def read_dice(path):
+    """
+    Rebuilds the dice written by write_dice.
+
+    Args:
+    - path (str): Parquet or Arrow IPC file.
+
+    Returns:
+    - Returns a list of Die objects with their weights.
+    """
+    _require()
+    frame = pd.concat([batch.to_pandas() for batch in _batches(path)], ignore_index=True)
+    dies = []
+    for _, state in frame.groupby('die', sort=True):
+        faces = _plain(state['face']).to_numpy()
+        die = Die(faces)
+        die.set_weights(state['weights'].to_numpy())
+        dies.append(die)
+    return dies
+
+
+##Analyzer outputs
+def write_frame(frame, path):
+    """
+    Writes any Analyzer output (or other data frame), keeping its index, MultiIndex included.
+
+    Column labels are written as strings; the original labels and their dtype go into the schema metadata, so face
+    columns such as rolled_event's come back as they were.
+
+    Args:
+    - frame (pd.DataFrame): data frame to write.
+    - path (str): Parquet or Arrow IPC file.
+    """
+    _require()
+    columns = {'labels': frame.columns.tolist(), 'dtype': str(frame.columns.dtype), 'name': frame.columns.name}
+    frame = frame.copy()
+    frame.columns = frame.columns.map(str)
+    table = pa.Table.from_pandas(frame)
+    table = table.replace_schema_metadata({**table.schema.metadata, _COLUMNS_KEY: json.dumps(columns)})
+    writer = _Writer(path, table.schema)
+    for batch in table.to_batches():
+        writer.write(batch)
+    writer.close()
+
+
+def read_frame(path):
+    """
+    Reads a data frame written by write_frame.
+
+    Args:
+    - path (str): Parquet or Arrow IPC file.
+
+    Returns:
+    - Returns the data frame.
+    """
+    _require()
+    if _is_parquet(path):
+        table = pq.read_table(path)
+    else:
+        table = ipc.open_file(path).read_all()
+    frame = table.to_pandas()
+    metadata = table.schema.metadata or {}
+    if _COLUMNS_KEY in metadata:
+        columns = json.loads(metadata[_COLUMNS_KEY])
+        frame.columns = pd.Index(columns['labels'], dtype=columns['dtype'], name=columns['name'])
+    return frame
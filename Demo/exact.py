@@ -0,0 +1,170 @@
+from itertools import combinations_with_replacement
+from math import comb
+
+import numpy as np
+import pandas as pd
+
+from .montecarlo import Game
+
+
+##ExactAnalyzer class, same statistics as Analyzer computed from the die weights instead of from rolls
+class ExactAnalyzer:
+    """
+    An ExactAnalyzer object computes the statistics of the Analyzer exactly from the weights of a game's dice, without playing it.
+
+    Every method returns probabilities, or expected counts when given a number of rolls, in the same shape as the matching Analyzer method.
+
+    Attributes:
+    - game object as parameter
+    - max_outcomes (int): largest number of outcomes that is enumerated before giving up.
+
+    Raises:
+    ValueError:  if the passed value is not a Game object
+    """
+    def __init__(self, game, max_outcomes=10**7):
+        """
+        Takes a game object as its input parameter. Throw a ValueError if the passed value is not a Game object.
+
+        Args:
+        - game object as parameter
+        - max_outcomes (int): largest number of permutations or combinations that is enumerated; defaults to 10**7.
+
+        Raises:
+        ValueError:  if the passed value is not a Game object
+        """
+        if not isinstance(game, Game):
+            raise ValueError("Passed value is not a Game Object!!")
+        self.game = game
+        self.max_outcomes = max_outcomes
+
+    def _probabilities(self):
+        """
+        The game's stacked probability matrix.
+
+        Returns:
+        - Returns the face lookup (np.array) and a (number of dice, faces) probability matrix.
+        """
+        return self.game._probabilities()
+
+    def _check_size(self, outcomes):
+        """
+        Raises a ValueError if there are more outcomes than max_outcomes.
+        """
+        if outcomes > self.max_outcomes:
+            raise ValueError(f"Too many outcomes to enumerate ({outcomes})!!")
+
+    @staticmethod
+    def _frame(faces, codes, probs, rolls, names=None):
+        """
+        Builds the MultiIndex data frame of face tuples, most likely first, dropping impossible outcomes.
+
+        Returns:
+        - Returns a data frame with a probability column, or an expected counts column if rolls is given.
+        """
+        keep = probs > 0
+        codes, probs = codes[keep], probs[keep]
+        order = np.argsort(-probs, kind='stable')
+        index = pd.MultiIndex.from_arrays(list(faces[codes[order]].T), names=names)
+        if rolls is None:
+            return pd.DataFrame({'probability': probs[order]}, index=index)
+        return pd.DataFrame({'counts': probs[order] * rolls}, index=index)
+
+    def _permutation_probs(self, probs):
+        """
+        Enumerates every ordered outcome and its probability.
+
+        Returns:
+        - Returns the integer codes of shape (outcomes, number of dice) and their probabilities.
+        """
+        n_dice, n_faces = probs.shape
+        self._check_size(n_faces ** n_dice)
+        codes = np.indices((n_faces,) * n_dice).reshape(n_dice, -1).T
+        return codes, np.prod(probs[np.arange(n_dice), codes], axis=1)
+
+    ##jackpot probability
+    def jackpot(self, rolls=None):
+        """
+        Probability of a jackpot, the sum over faces of the product of each die's probability of that face.
+
+        Args:
+        - rolls (int, optional): number of rolls to return the expected number of jackpots for.
+
+        Returns:
+        -Returns the jackpot probability, or the expected number of jackpots, as a float.
+        """
+        _, probs = self._probabilities()
+        p = np.sum(np.prod(probs, axis=0))
+        return p if rolls is None else p * rolls
+
+    ##facecounts distribution
+    def rolled_event(self, rolls=None):
+        """
+        Distribution of how many times each face shows up in a single roll.
+
+        Each face's count is a sum of one Bernoulli per die, so its distribution is the convolution of the dice.
+        Same shape as Analyzer.rolled_event(chunks=...): index of counts 0 to number of dice, face values as columns.
+
+        Args:
+        - rolls (int, optional): number of rolls to return the expected number of rolls for.
+
+        Returns:
+        -Returns a data frame of probabilities, or expected numbers of rolls.
+        """
+        faces, probs = self._probabilities()
+        n_dice, n_faces = probs.shape
+        dist = np.zeros((n_dice + 1, n_faces))
+        dist[0] = 1.0
+        for p in probs:
+            dist[1:] = dist[1:] * (1 - p) + dist[:-1] * p
+            dist[0] *= 1 - p
+        if rolls is not None:
+            dist = dist * rolls
+        return pd.DataFrame(dist, columns=pd.Index(faces), index=pd.RangeIndex(n_dice + 1, name='count'))
+
+    ##combination distribution
+    def combo_faces(self, rolls=None):
+        """
+        Probability of each distinct, order-independent combination of faces.
+
+        Similar dice use the multinomial formula over every multiset of faces; mixed dice add up their permutations.
+
+        Args:
+        - rolls (int, optional): number of rolls to return expected counts for.
+
+        Returns:
+        -Returns a data frame with a MultiIndex of combinations and a probability or counts column.
+        """
+        faces, probs = self._probabilities()
+        n_dice, n_faces = probs.shape
+        if np.all(probs == probs[0]):
+            self._check_size(comb(n_faces + n_dice - 1, n_dice))
+            codes = np.array(list(combinations_with_replacement(range(n_faces), n_dice)), dtype=np.intp).reshape(-1, n_dice)
+            counts = (codes[:, :, None] == np.arange(n_faces)).sum(axis=1)
+            log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n_dice + 1)))])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                log_p = np.log(probs[0])
+                terms = np.where(counts > 0, counts * log_p, 0.0)
+            combo_probs = np.exp(log_fact[n_dice] - log_fact[counts].sum(axis=1) + terms.sum(axis=1))
+            return self._frame(faces, codes, combo_probs, rolls)
+        codes, perm_probs = self._permutation_probs(probs)
+        codes = np.sort(codes, axis=1)
+        keys = np.ravel_multi_index(codes.T, (n_faces,) * n_dice)
+        keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        return self._frame(faces, codes[first], np.bincount(inverse, weights=perm_probs), rolls)
+
+    ##permutation distribution
+    def distinct_permutations(self, rolls=None):
+        """
+        Probability of each distinct permutation of faces, the product of each die's probability of its face.
+
+        Args:
+        - rolls (int, optional): number of rolls to return expected counts for.
+
+        Returns:
+        -Returns a data frame with a MultiIndex of face tuples (one level per die) and a probability or counts column.
+        """
+        faces, probs = self._probabilities()
+        codes, perm_probs = self._permutation_probs(probs)
+        names = [f'die_{idx}' for idx in range(len(self.game.dies))]
+        return self._frame(faces, codes, perm_probs, rolls, names)
+
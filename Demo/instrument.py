@@ -0,0 +1,119 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+##callbacks that receive one record per instrumented call, empty means instrumentation is off
+_hooks = []
+
+
+def _timed(stage, rows=None):
+    """
+    Instruments a method: with hooks registered, each call sends a record of its wall time, rows handled and bytes allocated.
+
+    With no hooks registered the only cost is one check of the hook list.
+
+    Args:
+    - stage (str): name of the stage, e.g. 'Game.play'.
+    - rows (function, optional): computes the rows handled from (func, args, kwargs, result), None if unknown.
+
+    Returns:
+    - Returns the decorator.
+    """
+    def decorate(func):
+        @wraps(func)
+        def timed(*args, **kwargs):
+            if not _hooks:
+                return func(*args, **kwargs)
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            seconds = time.perf_counter() - started
+            record = {
+                'stage': stage,
+                'seconds': seconds,
+                'rows': rows(func, args, kwargs, result) if rows is not None else None,
+                'bytes': tracemalloc.get_traced_memory()[1] - before if tracing else None,
+            }
+            for hook in list(_hooks):
+                hook(record)
+            return result
+        return timed
+    return decorate
+
+
+def add_hook(callback):
+    """
+    Registers a callback that receives a dict (stage, seconds, rows, bytes) after every instrumented call.
+
+    Args:
+    - callback (function): called with one record per call.
+    """
+    _hooks.append(callback)
+
+
+def remove_hook(callback):
+    """
+    Unregisters a callback added with add_hook.
+
+    Args:
+    - callback (function): callback to remove.
+    """
+    if callback in _hooks:
+        _hooks.remove(callback)
+
+
+class Stats:
+    """
+    Collects the records of instrumented calls, for use as a hook.
+
+    Attributes:
+    - records (list): one dict per instrumented call, in call order.
+    """
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def summary(self):
+        """
+        Totals per stage.
+
+        Returns:
+        - Returns a data frame indexed by stage with calls, seconds, rows, rows per second and bytes allocated.
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame(self.records, columns=['stage', 'seconds', 'rows', 'bytes'])
+        totals = frame.groupby('stage', sort=False).agg(calls=('seconds', 'size'), seconds=('seconds', 'sum'),
+                                                          rows=('rows', 'sum'), bytes=('bytes', 'sum'))
+        totals.insert(3, 'rows_per_second', totals['rows'] / totals['seconds'])
+        return totals
+
+
+@contextmanager
+def profile(memory=False):
+    """
+    Records every instrumented call made inside the with block.
+
+    Args:
+    - memory (bool): also measure bytes allocated with tracemalloc, which slows the calls down; defaults to False.
+
+    Returns:
+    - Returns a context manager that yields the Stats collecting the records.
+    """
+    stats = Stats()
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    add_hook(stats)
+    try:
+        yield stats
+    finally:
+        remove_hook(stats)
+        if started:
+            tracemalloc.stop()
@@ -1,5 +1,76 @@
+import sys
+import time
+from collections import OrderedDict, deque
+from functools import wraps
+
 import numpy as np
-import pandas as pd
+
+from .instrument import _timed
+
+##rolls per block, every block of a play gets its own random stream
+_BLOCK_ROLLS = 1 << 16
+
+##mixed dice with up to this many faces are sampled by scanning the cumulative bounds instead of searchsorted
+_SCAN_FACES = 64
+
+
+def _seed_sequence(seed):
+    """
+    Turns a seed into a numpy SeedSequence.
+
+    Args:
+    - seed (int, sequence of ints, SeedSequence or None): seed to use, None draws fresh entropy from the OS.
+
+    Returns:
+    - Returns a np.random.SeedSequence.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def _result_rows(func, args, kwargs, result):
+    """
+    Rows returned by a call, for instrumentation.
+    """
+    return len(result)
+
+
+def _play_rows(func, args, kwargs, result):
+    """
+    Rolls asked of Game.play, for instrumentation.
+    """
+    return kwargs['rolls'] if 'rolls' in kwargs else args[1]
+
+
+def _analyzer_rows(func, args, kwargs, result):
+    """
+    Rolls read by an Analyzer call, None for streamed chunks whose length is not known up front.
+
+    The call is bound to the method's signature by the _memoized wrapper, so chunks is found however it was passed.
+    """
+    analyzer = args[0]
+    if func.arguments(args, kwargs)['chunks'] is not None or analyzer.game._data is None:
+        return None
+    return len(analyzer.game._data)
+
+
+def _play_shard(dies, plan, seeds, rolls):
+    """
+    Worker side of a parallel play, draws a run of consecutive blocks.
+
+    Args:
+    - dies (list): dice of the game.
+    - plan (dict): sampling plan from Game._plan.
+    - seeds (list): SeedSequence of each block in the shard.
+    - rolls (int): number of rolls in the shard.
+
+    Returns:
+    - Returns the integer codes of the shard.
+    """
+    codes = np.empty((rolls, len(dies)), dtype=plan['dtype'])
+    Game(dies)._fill(plan, seeds, codes)
+    return codes
 
     # test function, needs to throw type error if not a NumPy Array
 
@@ -10,14 +81,17 @@ class Die:
 
     Attributes:
     - faces(N) (np.array): Array of faces of the die.
-    - _data (pd.DataFrame): Private data frame that stores the die weights.
+    - _faces (np.array): Private copy of the faces, in the order they were given.
+    - _weights (np.array): Private float array of the weights, one per face.
+    - _positions (dict): Private map from each face to its position in _faces.
     """
-    def __init__(self, N):
+    def __init__(self, N, seed=None):
         """
         Initializes a Die with face data.
 
         Args:
         - faces(N) (np.array): Array of faces of the die..
+        - seed (int, SeedSequence or np.random.Generator, optional): seed or generator for the die's own random stream used by roll.
 
         Raised errors:
         - TypeError: Throws a TypeError if not a Numpy array.
@@ -29,7 +103,11 @@ class Die:
         if len(N) != len(np.unique(N)):
             raise ValueError("Faces values must be unique!!")
 
-        self._data = pd.DataFrame({'weights': [1.0]*len(N)}, index=N)
+        self._faces = N.copy()
+        self._weights = np.ones(len(N))
+        self._positions = {face: idx for idx, face in enumerate(N.tolist())}
+        self._alias = None
+        self._rng = np.random.default_rng(seed)
         
     def change_weight(self, N, new_weight):
         """
@@ -43,35 +121,121 @@ class Die:
         - IndexError: If the face value is not valid.
         - TypeError: If weight is not numeric (interger or float) or castable numeric.
         """
-        if N not in self._data.index:
+        if N not in self._positions:
             raise IndexError("Face value not valid!!")
 
         if not (isinstance(new_weight, (int, float)) or str(new_weight).isnumeric()):
             raise TypeError("Weight value is not numeric!!")
 
-        self._data.loc[N, 'weights'] = new_weight
+        self._weights[self._positions[N]] = float(new_weight)
+        ##weights changed, alias table is rebuilt on the next roll
+        self._alias = None
+
+    ##change many weights at once
+    def set_weights(self, weights):
+        """
+        A method to change the weights of many sides at once.
+
+        Args:
+        - weights (array-like, dict or pd.Series): one weight per face in face order, or a map from face to weight
+          (a Series maps its index to its values); faces left out of a map keep their weight.
+
+        Raises:
+        - IndexError: If a face of the map is not valid.
+        - TypeError: If a weight is not numeric or castable numeric.
+        - ValueError: If an array does not have one weight per face.
+        """
+        if hasattr(weights, 'items'):
+            ##a dict or a Series, read as face: weight pairs
+            weights = dict(weights.items())
+            try:
+                positions = [self._positions[face] for face in weights]
+            except (KeyError, TypeError):
+                raise IndexError("Face value not valid!!")
+            weights = list(weights.values())
+        else:
+            positions = slice(None)
+        try:
+            values = np.asarray(weights, dtype=float)
+        except (TypeError, ValueError):
+            raise TypeError("Weight value is not numeric!!")
+        if isinstance(positions, slice) and values.shape != self._weights.shape:
+            raise ValueError("Need one weight per face!!")
+        self._weights[positions] = values
+        ##weights changed, alias table is rebuilt on the next roll
+        self._alias = None
+
+    def _alias_table(self):
+        """
+        Walker/Vose alias table for the current weights, built once per weight state.
+
+        Returns:
+        - Returns the acceptance probabilities and alias positions as two arrays, one entry per face.
+        """
+        if self._alias is None:
+            weights = self._weights
+            n = len(weights)
+            scaled = weights * n / np.sum(weights)
+            prob = np.ones(n)
+            alias = np.arange(n)
+            small = [i for i in range(n) if scaled[i] < 1.0]
+            large = [i for i in range(n) if scaled[i] >= 1.0]
+            while small and large:
+                lo = small.pop()
+                hi = large.pop()
+                prob[lo] = scaled[lo]
+                alias[lo] = hi
+                scaled[hi] = scaled[hi] + scaled[lo] - 1.0
+                if scaled[hi] < 1.0:
+                    small.append(hi)
+                else:
+                    large.append(hi)
+            self._alias = (prob, alias)
+        return self._alias
+
+    def _sample(self, size, rng=None):
+        """
+        Draws face positions from the alias table, O(1) per draw.
+
+        Args:
+        - size (int or tuple): shape of the array of draws.
+        - rng (np.random.Generator, optional): generator to draw from; defaults to the die's own stream.
+
+        Returns:
+        - Returns an integer array of positions into the die's faces.
+        """
+        if rng is None:
+            rng = self._rng
+        prob, alias = self._alias_table()
+        picks = rng.integers(len(prob), size=size)
+        return np.where(rng.random(size) < prob[picks], picks, alias[picks])
         
-    def roll(self, rolls=1):
+    @_timed('Die.roll', _result_rows)
+    def roll(self, rolls=1, as_array=False):
         """
         method to roll the die one or more times.
 
         Args:
         - how many times the die is to be rolled; defaults to  1
+        - as_array (bool): return the outcomes as a np.array of faces instead of a list; defaults to False.
 
         Returns:
         - Returns a Python list of outcomes.
         """
         ##not to internally store results
-        return np.random.choice(self._data.index, size=rolls, p=self._data['weights']/np.sum(self._data['weights'])).tolist()
+        outcomes = self._faces[self._sample(rolls)]
+        return outcomes if as_array else outcomes.tolist()
     
     def current_state(self):
         """
         Dies current state
 
         Returns:
-        - Returns a copy of the private die data frame.
+        - Returns a data frame of the weights indexed by face, built from the private arrays.
         """
-        return self._data.copy()      
+        import pandas as pd
+
+        return pd.DataFrame({'weights': self._weights.copy()}, index=self._faces.copy())
         
 #Game Class
 class Game:
@@ -82,51 +246,376 @@ class Game:
     - list of already instantiated similar dice.
     """
     ##Takes a single parameter, a list of already instantiated similar dice
-    def __init__(self, dies):
+    def __init__(self, dies, seed=None):
         """
         Initializes a Die with face data. Takes a single parameter, a list of already instantiated similar dice
 
         Args:
         - takes a single parameter, a list of already instantiated similar dice.
+        - seed (int or SeedSequence, optional): root seed of the game; every play without its own seed spawns a new stream from it.
         """
         self.dies = dies
+        self._seed = _seed_sequence(seed)
         self._data = None
-        
+        ##array the codes live in, _data is its filled rows; appends double its capacity when it is full
+        self._buffer = None
+        ##(root SeedSequence, rolls) of each play in the stored results, in roll order
+        self._plays = []
+        ##bumped whenever a play replaces the results, appending keeps it
+        self._run = 0
+        ##bumped whenever the results change
+        self._version = 0
+        self._faces = None
+
+    def _face_lookup(self):
+        """
+        Builds the shared face lookup for the dice in the game.
+
+        Returns:
+        - Returns the face lookup (np.array) and, for each die, an array that maps the die's own face positions onto it.
+        """
+        faces = self.dies[0]._faces
+        if all(np.array_equal(faces, die._faces) for die in self.dies[1:]):
+            return faces, [np.arange(len(faces))] * len(self.dies)
+        ##union of the faces in first-seen order
+        positions = {}
+        for die in self.dies:
+            for face in die._faces.tolist():
+                positions.setdefault(face, len(positions))
+        try:
+            dtype = np.result_type(*[die._faces for die in self.dies])
+        except TypeError:
+            dtype = object
+        faces = np.array(list(positions), dtype=dtype)
+        remaps = [np.array([positions[face] for face in die._faces.tolist()]) for die in self.dies]
+        return faces, remaps
+
+    def _probabilities(self):
+        """
+        Stacks each die's normalized weights over the shared face lookup.
+
+        Returns:
+        - Returns the face lookup (np.array) and a (number of dice, faces) probability matrix.
+        """
+        faces, remaps = self._face_lookup()
+        probs = np.zeros((len(self.dies), len(faces)))
+        for idx, (die, remap) in enumerate(zip(self.dies, remaps)):
+            probs[idx, remap] = die._weights / np.sum(die._weights)
+        return faces, probs
+
+    def _plan(self):
+        """
+        Works out how the dice are sampled.
+
+        Similar dice (same faces and weights) share the first die's alias table. Mixed dice are sampled together from
+        the cumulative rows of the stacked probability matrix by inverse CDF, see _draw.
+        Codes are stored in the smallest unsigned dtype that can index the face lookup (uint8 for up to 256 faces).
+
+        Returns:
+        - Returns the face lookup and the sampling plan (dict).
+        """
+        faces, remaps = self._face_lookup()
+        dtype = np.min_scalar_type(max(len(faces) - 1, 0))
+        weights = [die._weights for die in self.dies]
+        if all(np.array_equal(remap, remaps[0]) and np.array_equal(w, weights[0]) for remap, w in zip(remaps, weights)):
+            return faces, {'similar': True, 'dtype': dtype, 'remap': remaps[0].astype(dtype)}
+        faces, probs = self._probabilities()
+        cumulative = np.cumsum(probs, axis=1)
+        ##close every row at exactly 1 from its last possible face on, so rounding never picks an impossible face
+        last = len(faces) - 1 - np.argmax(probs[:, ::-1] > 0, axis=1)
+        cumulative[np.arange(len(faces)) >= last[:, None]] = 1.0
+        return faces, {'similar': False, 'dtype': dtype, 'last': last, 'cumulative': cumulative}
+
+    def _draw(self, plan, seed, out):
+        """
+        Fills one block of integer codes.
+
+        Args:
+        - plan (dict): sampling plan from _plan.
+        - seed (SeedSequence): seed of the block's random stream.
+        - out (np.array): block of the code array to fill, shape (rolls, number of dice).
+        """
+        rng = np.random.default_rng(seed)
+        if plan['similar']:
+            ##similar dice, one draw for the whole block
+            out[:] = plan['remap'][self.dies[0]._sample(out.shape, rng)]
+        elif plan['cumulative'].shape[1] <= _SCAN_FACES:
+            ##few faces, count the cumulative bounds each uniform draw has passed, one face column at a time
+            draws = rng.random(out.shape)
+            out[:] = 0
+            for bound in plan['cumulative'][:, :-1].T:
+                out += draws >= bound
+        else:
+            ##many faces, offset the cumulative rows by the die number so one searchsorted does every die
+            n_faces = plan['cumulative'].shape[1]
+            offsets = np.arange(out.shape[1])
+            cumulative = (plan['cumulative'] + offsets[:, None]).ravel()
+            spots = np.searchsorted(cumulative, rng.random(out.shape) + offsets, side='right')
+            out[:] = np.minimum(spots - offsets * n_faces, plan['last'])
+
+    def _fill(self, plan, seeds, out):
+        """
+        Fills consecutive blocks of integer codes, one seed per block.
+
+        Args:
+        - plan (dict): sampling plan from _plan.
+        - seeds (list): SeedSequence of each block.
+        - out (np.array): code array to fill, shape (rolls, number of dice).
+        """
+        for block, seed in enumerate(seeds):
+            start = block * _BLOCK_ROLLS
+            self._draw(plan, seed, out[start:start + _BLOCK_ROLLS])
+
 ##play method how many times dice should be rolled 
-    def play(self, rolls):
+    @_timed('Game.play', _play_rows)
+    def play(self, rolls, seed=None, workers=None, append=False):
         """
        play method how many times dice should be rolled
 
+        Every die's outcomes are drawn in one batch into a single integer-code array of shape (rolls, number of dice).
+        Codes are positions in the shared face lookup, stored in the smallest unsigned dtype that fits;
+        faces are only filled in by play_results.
+        Rolls are drawn in fixed-size blocks, each with its own stream spawned from the play's seed,
+        so a seeded play gives the same results however it is split up.
+        With workers, the blocks are split into contiguous shards across a process pool and merged back in roll order;
+        the results are identical to a single-process play with the same seed.
+
         Args:
         - interger parameter how many times dice should be rolled. 
+        - seed (int or SeedSequence, optional): seed for this play; defaults to a new stream spawned from the game's seed.
+        - workers (int, optional): number of worker processes; defaults to playing in this process.
+        - append (bool): add the new rolls after the results of the previous play instead of replacing them; defaults to False.
+          The rolls are drawn straight into a buffer whose capacity doubles when it runs out, so repeated appends cost
+          amortized O(rolls) each instead of copying the whole history.
+
+        Raises:
+        - ValueError: if appending with a different number of dice or a different face lookup than the stored play.
         """
-        results = {}
-        for idx, die in enumerate(self.dies):
-            results[f'die_{idx}'] = die.roll(rolls)
-        self._data = pd.DataFrame(results)
-        
+        root = _seed_sequence(seed) if seed is not None else self._seed.spawn(1)[0]
+        faces, plan = self._plan()
+        append = append and self._data is not None
+        if append:
+            if self._data.shape[1] != len(self.dies) or not np.array_equal(faces, self._faces):
+                raise ValueError("Cannot append, the dice changed since the stored play!!")
+            codes = self._grow(rolls)
+        else:
+            codes = np.empty((rolls, len(self.dies)), dtype=plan['dtype'])
+        seeds = root.spawn(-(-rolls // _BLOCK_ROLLS))
+        if workers is None or workers <= 1 or len(seeds) <= 1:
+            self._fill(plan, seeds, codes)
+        else:
+            shards = [blocks for blocks in np.array_split(np.arange(len(seeds)), workers) if len(blocks)]
+            starts = [blocks[0] * _BLOCK_ROLLS for blocks in shards]
+            stops = [min((blocks[-1] + 1) * _BLOCK_ROLLS, rolls) for blocks in shards]
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+                parts = pool.map(_play_shard,
+                                 [self.dies] * len(shards), [plan] * len(shards),
+                                 [seeds[blocks[0]:blocks[-1] + 1] for blocks in shards],
+                                 [stop - start for start, stop in zip(starts, stops)])
+                for start, stop, part in zip(starts, stops, parts):
+                    codes[start:stop] = part
+        if append:
+            self._data = self._buffer[:len(self._data) + rolls]
+            self._plays.append((root, rolls))
+        else:
+            self._faces = faces
+            self._buffer = self._data = codes
+            self._plays = [(root, rolls)]
+            self._run += 1
+        self._version += 1
+
+    def _grow(self, rolls):
+        """
+        Makes room for rolls more codes after the stored ones, doubling the buffer's capacity when it is full.
+
+        Results that do not live in the buffer, e.g. a memory-mapped store, are copied into a new one first.
+
+        Args:
+        - rolls (int): number of rolls to add.
+
+        Returns:
+        - Returns the (rolls, number of dice) view of the buffer to draw the new codes into.
+        """
+        stored = len(self._data)
+        owned = self._buffer is not None and (self._data is self._buffer or self._data.base is self._buffer)
+        if not owned or stored + rolls > len(self._buffer):
+            capacity = max(stored + rolls, 2 * len(self._buffer) if owned else stored)
+            buffer = np.empty((capacity, self._data.shape[1]), dtype=self._data.dtype)
+            buffer[:stored] = self._data
+            self._buffer = buffer
+        return self._buffer[stored:stored + rolls]
+
+    ##streaming play, results are never stored on the game
+    def play_stream(self, rolls, chunk_size=_BLOCK_ROLLS, seed=None):
+        """
+        Plays the game chunk by chunk so the full results never have to fit in memory.
+
+        The stream draws the same blocks as play, so with the same seed the chunks stacked together equal play's results.
+
+        Args:
+        - rolls (int): total number of rolls.
+        - chunk_size (int): rolls per yielded chunk, the last chunk may be shorter; defaults to one block.
+        - seed (int or SeedSequence, optional): seed for this play; defaults to a new stream spawned from the game's seed.
+
+        Returns:
+        - Returns a generator of integer-code arrays of shape (chunk rolls, number of dice), for Analyzer methods or _decode.
+          The codes index the dice's current face lookup, Game._face_lookup, which may differ from the stored play's.
+
+        Raises:
+        - ValueError: if chunk_size is below 1.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1!!")
+        root = _seed_sequence(seed) if seed is not None else self._seed.spawn(1)[0]
+        _, plan = self._plan()
+        n_dice = len(self.dies)
+        chunk, fill = None, 0
+        for block, block_seed in enumerate(root.spawn(-(-rolls // _BLOCK_ROLLS))):
+            start = block * _BLOCK_ROLLS
+            size = min(_BLOCK_ROLLS, rolls - start)
+            if chunk is None:
+                chunk, fill = np.empty((min(chunk_size, rolls - start), n_dice), dtype=plan['dtype']), 0
+            if fill + size <= len(chunk):
+                ##the whole block fits, draw it in place
+                self._draw(plan, block_seed, chunk[fill:fill + size])
+                fill += size
+            else:
+                ##the block overruns the chunk: top the chunk up, yield the whole chunks after it as views of the block
+                ##and carry only the leftover into the next chunk
+                codes = np.empty((size, n_dice), dtype=plan['dtype'])
+                self._draw(plan, block_seed, codes)
+                done = len(chunk) - fill
+                chunk[fill:] = codes[:done]
+                yield chunk
+                chunk = None
+                while size - done >= min(chunk_size, rolls - start - done) > 0:
+                    length = min(chunk_size, rolls - start - done)
+                    yield codes[done:done + length]
+                    done += length
+                if done < size:
+                    chunk = np.empty((min(chunk_size, rolls - start - done), n_dice), dtype=plan['dtype'])
+                    fill = size - done
+                    chunk[:fill] = codes[done:]
+            if chunk is not None and fill == len(chunk):
+                yield chunk
+                chunk = None
+
+    def _decode(self, codes, start=0, faces=None):
+        """
+        Turns an integer-code array into the wide data frame of faces.
+
+        Args:
+        - codes (np.array): integer codes of shape (rolls, number of dice).
+        - start (int): roll number of the first row; defaults to 0.
+        - faces (np.array, optional): face lookup the codes index; defaults to the stored play's.
+
+        Returns:
+        - Returns a wide data frame indexed by roll number with one column per die.
+        """
+        import pandas as pd
+
+        if faces is None:
+            faces = self._faces
+        columns = [f'die_{idx}' for idx in range(codes.shape[1])]
+        index = pd.RangeIndex(start, start + len(codes))
+        return pd.DataFrame(faces[codes], index=index, columns=columns)
+
 ##results of most recent play
+    @_timed('Game.play_results', _result_rows)
     def play_results(self, form='wide'):
         """
         results of most recent play
 
         Args:
-        - Takes a parameter to return the data frame in narrow or wide form which defaults to wide form.
+        - Takes a parameter to return the data frame in narrow or wide form which defaults to wide form,
+          or 'array' for a np.array of faces of shape (rolls, number of dice) without going through pandas.
 
         Raises:
         - ValueError:if the user passes an invalid option for narrow or wide.
         """
+        if form == 'array':
+            if self._data is None:
+                return np.empty((0, len(self.dies)))
+            return self._faces[self._data]
+
+        import pandas as pd
+
         if form == 'wide':
             if self._data is None:
                 return pd.DataFrame()
-            return self._data.copy()
+            return self._decode(self._data)
         elif form == 'narrow':
             if self._data is None:
                 return pd.DataFrame()
             else:
-                return self._data.melt(ignore_index=False, var_name='die_number', value_name='outcomes')
+                return self._decode(self._data).melt(ignore_index=False, var_name='die_number', value_name='outcomes')
         else:
-            raise ValueError("Invalid option passed, choose 'wide' or 'narrow'!!")
+            raise ValueError("Invalid option passed, choose 'wide', 'narrow' or 'array'!!")
+
+def _memoized(method):
+    """
+    Caches an Analyzer method's result per game version and arguments, in the Analyzer's bounded LRU cache.
+
+    Calls with chunks are streamed and never cached. Data frames are handed out as copies so the cached ones stay intact.
+
+    Args:
+    - method (function): Analyzer method to cache.
+
+    Returns:
+    - Returns the caching method.
+    """
+    ##the signature is only worked out on the first call, so importing the module stays cheap
+    signature = []
+
+    def bind(args, kwargs):
+        """
+        The arguments of a call to method, self included, by parameter name with the defaults filled in.
+        """
+        if not signature:
+            import inspect
+
+            signature.append(inspect.signature(method))
+        bound = signature[0].bind(*args, **kwargs)
+        bound.apply_defaults()
+        return bound.arguments
+
+    @wraps(method)
+    def cached(self, *args, **kwargs):
+        bound = bind((self,) + args, kwargs)
+        arguments = tuple((name, value) for name, value in bound.items() if name != 'self')
+        if bound.get('chunks') is not None or self._cache_size <= 0:
+            return method(self, *args, **kwargs)
+        ##the version only counts plays of one game, results of a game swapped in through Analyzer.game are not its
+        if self._cache_game is not self.game:
+            self._cache.clear()
+            self._cache_game = self.game
+        version = self.game._version
+        key = (method.__name__, arguments, version)
+        cache = self._cache
+        if key in cache:
+            self._hits += 1
+            cache.move_to_end(key)
+        else:
+            self._misses += 1
+            ##results of older versions can never be hit again
+            for stale in [old for old in cache if old[2] != version]:
+                del cache[stale]
+            cache[key] = method(self, *args, **kwargs)
+            while len(cache) > self._cache_size:
+                cache.popitem(last=False)
+        result = cache[key]
+        ##a cached data frame means pandas is loaded already, never import it just for this check
+        pd = sys.modules.get('pandas')
+        if pd is None:
+            return result
+        if isinstance(result, dict):
+            return {name: value.copy() if isinstance(value, pd.DataFrame) else value for name, value in result.items()}
+        return result.copy() if isinstance(result, pd.DataFrame) else result
+    cached.arguments = bind
+    return cached
+
 
 ##Analyzer class, Throw a ValueError if the passed value is not a Game object
 class Analyzer:
@@ -135,16 +624,26 @@ class Analyzer:
 
     Attributes:
     - game object as parameter
+    - incremental (bool): keep running tallies and fold in only the rolls appended since the last call.
+    - cache_size (int): number of results kept in the Analyzer's cache.
+    - threads (int): number of threads the statistics are computed with, over row partitions.
     
     Raises:
     ValueError:  if the passed value is not a Game object
     """
-    def __init__(self, game):
+    def __init__(self, game, incremental=False, cache_size=32, threads=None):
         """
         Takes a game object as its input parameter. Throw a ValueError if the passed value is not a Game object.
 
         Attributes:
         - game object as parameter
+        - incremental (bool): cache the jackpot count, per-roll face counts and combination and permutation tallies,
+          and update them with only the new rolls when the game is played with append=True; defaults to False.
+        - cache_size (int): number of results kept, least recently used first out, 0 turns caching off; defaults to 32.
+          Cached results are dropped automatically once the game is played again or another game is assigned.
+        - threads (int, optional): compute jackpot, rolled_event, combo_faces, distinct_permutations and summary over
+          row partitions in a pool of this many threads and merge the partial counts; the NumPy sorts, np.unique and
+          np.bincount calls release the GIL, so one process can use several cores. Defaults to computing in this thread.
     
         Raises:
         ValueError:  if the passed value is not a Game object
@@ -152,61 +651,652 @@ class Analyzer:
         if not isinstance(game, Game):
             raise ValueError("Passed value is not a Game Object!!")
         self.game = game
+        self.incremental = incremental
+        self._reset()
+        self._cache_size = cache_size
+        self.threads = threads
+        self._cache = OrderedDict()
+        ##game the cached results belong to
+        self._cache_game = game
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self):
+        """
+        Statistics of the result cache.
+
+        Returns:
+        - Returns a dict with the number of hits, misses, cached results and the cache size.
+        """
+        return {'hits': self._hits, 'misses': self._misses, 'size': len(self._cache), 'maxsize': self._cache_size}
+
+    def cache_clear(self):
+        """
+        Empties the result cache and resets its statistics.
+        """
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _reset(self):
+        """
+        Drops the incremental tallies.
+        """
+        self._run = None
+        ##game the tallies were taken over, runs of another game are counted separately
+        self._tallied = None
+        self._seen = 0
+        self._tallies = {'jackpot': np.int64(0), 'counts': [], 'combos': None, 'perms': None}
+
+    def _update(self):
+        """
+        Brings the incremental tallies up to date, starting over if the game was re-played or replaced and otherwise
+        folding in only the rolls appended since the last update.
+        """
+        if self._run != self.game._run or self._tallied is not self.game:
+            self._reset()
+            self._run = self.game._run
+            self._tallied = self.game
+        codes = self.game._data
+        if codes is None or len(codes) == self._seen:
+            return
+        tallies = self._tallies
+        new = codes[self._seen:]
+        tallies['jackpot'] += self._jackpots(new)
+        tallies['counts'].append(self._face_counts(new))
+        tallies['combos'] = self._fold_keys(tallies['combos'], self._combo_keys(new))
+        tallies['perms'] = self._fold_keys(tallies['perms'], self._keys(new))
+        self._seen = len(codes)
         
+    def _stored_chunks(self):
+        """
+        The game's stored codes as chunks; memory-mapped results are read block by block as zero-copy views.
+
+        Returns:
+        - Returns a list of integer-code arrays.
+        """
+        codes = self.game._data
+        if codes is None:
+            return []
+        if isinstance(codes, np.memmap):
+            return [codes[start:start + _BLOCK_ROLLS] for start in range(0, len(codes), _BLOCK_ROLLS)]
+        return [codes]
+
+    def _stored_dice(self):
+        """
+        Number of dice in the stored codes, which may differ from len(game.dies) if the dice changed after the play;
+        None before any play.
+        """
+        codes = self.game._data
+        return None if codes is None else codes.shape[1]
+
+    def _lookup(self, chunks=None):
+        """
+        The face lookup that codes index: the stored play's for stored results, the dice's current one for chunks,
+        which is the lookup Game.play_stream draws against.
+
+        Args:
+        - chunks (iterable, optional): streamed chunks, None for the stored play.
+
+        Returns:
+        - Returns the face lookup as a np.array.
+        """
+        if chunks is None:
+            return self.game._faces
+        return self.game._face_lookup()[0]
+
+    def _threaded(self):
+        """
+        True if the statistics are computed in a thread pool.
+        """
+        return self.threads is not None and self.threads > 1
+
+    def _partition_rows(self, rows):
+        """
+        Rows per partition when rows are split across the threads: at least a block, at most 1<<20 rows.
+        """
+        if not self._threaded():
+            return max(rows, 1)
+        return min(1 << 20, max(_BLOCK_ROLLS, -(-rows // self.threads)))
+
+    def _partitions(self, chunks):
+        """
+        Splits chunks into row partitions, one partition per chunk unless threads are used.
+
+        Args:
+        - chunks (iterable): integer-code arrays.
+
+        Returns:
+        - Returns a generator of integer-code arrays.
+        """
+        for codes in chunks:
+            step = self._partition_rows(len(codes))
+            for start in range(0, len(codes), step):
+                yield codes[start:start + step]
+
+    def _map(self, func, items):
+        """
+        Applies func to every item, in the thread pool when threads are used.
+
+        At most two items per thread are in flight, so a stream of chunks is never read far ahead.
+
+        Args:
+        - func (function): work on one item, e.g. one row partition.
+        - items (iterable): items to work on.
+
+        Returns:
+        - Returns a generator of the results, in item order.
+        """
+        if not self._threaded():
+            yield from map(func, items)
+            return
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            pending = deque()
+            for item in items:
+                pending.append(pool.submit(func, item))
+                if len(pending) >= 2 * self.threads:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _keys(self, codes, faces=None):
+        """
+        Packs each row of integer codes into a single key.
+
+        Rows are read as mixed-radix integers in int64 when the key space fits, otherwise as fixed-width void views.
+
+        Args:
+        - codes (np.array): integer codes of shape (rolls, number of dice).
+        - faces (np.array, optional): face lookup the codes index; defaults to the stored play's.
+
+        Returns:
+        - Returns a 1-d array with one key per roll.
+        """
+        radix = len(self.game._faces if faces is None else faces)
+        if radix ** codes.shape[1] <= np.iinfo(np.int64).max:
+            keys = np.zeros(len(codes), dtype=np.int64)
+            for col in range(codes.shape[1]):
+                keys *= radix
+                keys += codes[:, col]
+            return keys
+        codes = np.ascontiguousarray(codes)
+        return codes.view(np.dtype((np.void, codes.dtype.itemsize * codes.shape[1]))).ravel()
+
+    def _unkeys(self, keys, n_dice, faces=None):
+        """
+        Unpacks keys made by _keys back into rows of integer codes.
+
+        Args:
+        - keys (np.array): 1-d array of keys.
+        - n_dice (int): number of dice, the width of the codes the keys were packed from.
+        - faces (np.array, optional): face lookup the keys were packed with; defaults to the stored play's.
+
+        Returns:
+        - Returns the integer codes of shape (keys, number of dice).
+        """
+        n = n_dice
+        if keys.dtype.kind == 'V':
+            return keys.view(np.dtype(f'u{keys.dtype.itemsize // n}')).reshape(-1, n)
+        radix = len(self.game._faces if faces is None else faces)
+        codes = np.empty((len(keys), n), dtype=np.int64)
+        keys = keys.copy()
+        for col in range(n - 1, -1, -1):
+            keys, codes[:, col] = np.divmod(keys, radix)
+        return codes
+
+    def _combo_keys(self, codes, faces=None):
+        """
+        Row keys of the sorted face codes, equal for rolls with the same combination.
+        """
+        return self._keys(np.sort(codes, axis=1), faces)
+
+    @staticmethod
+    def _merge_tallies(tally, part):
+        """
+        Merges partial key counts into a running tally.
+
+        Args:
+        - tally (tuple or None): running (keys, counts), None to start a new one.
+        - part (tuple): (keys, counts) of one chunk or partition, keys distinct.
+
+        Returns:
+        - Returns the merged (keys, counts).
+        """
+        if tally is None:
+            return part
+        keys, inverse = np.unique(np.concatenate([tally[0], part[0]]), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate([tally[1], part[1]])).astype(np.int64)
+        return keys, counts
+
+    @staticmethod
+    def _fold_keys(tally, keys):
+        """
+        Merges the key counts of one chunk into a running tally.
+
+        Args:
+        - tally (tuple or None): running (keys, counts), None to start a new one.
+        - keys (np.array): row keys of the chunk.
+
+        Returns:
+        - Returns the merged (keys, counts).
+        """
+        return Analyzer._merge_tallies(tally, np.unique(keys, return_counts=True))
+
+    def _count_keys(self, keys_of, chunks, named=False, faces=None):
+        """
+        Counts distinct row keys over a stream of chunks, merging the partial counts after each chunk or partition.
+
+        Args:
+        - keys_of (function): turns one integer-code chunk and a face lookup into row keys.
+        - chunks (iterable): integer-code arrays, e.g. from Game.play_stream.
+        - named (bool): name the MultiIndex levels after the dice; defaults to False.
+        - faces (np.array, optional): face lookup the codes index; defaults to the stored play's.
+
+        Returns:
+        - Returns a data frame with a MultiIndex of face tuples and a counts column, most frequent first.
+        """
+        tally = n_dice = None
+        parts = self._map(lambda codes: (np.unique(keys_of(codes, faces), return_counts=True), codes.shape[1]),
+                          self._partitions(chunks))
+        for part, n_dice in parts:
+            tally = self._merge_tallies(tally, part)
+        return self._tally_frame(tally, n_dice, named, faces)
+
+    def _tally_frame(self, tally, n_dice, named=False, faces=None):
+        """
+        Builds the counts data frame of a (keys, counts) tally.
+
+        Args:
+        - tally (tuple or None): (keys, counts), None for no rolls.
+        - n_dice (int or None): width of the codes the keys were packed from, None for no rolls.
+        - named (bool): name the MultiIndex levels after the dice, die_0, die_1, ...; defaults to False.
+        - faces (np.array, optional): face lookup the keys were packed with; defaults to the stored play's.
+
+        Returns:
+        - Returns a data frame with a MultiIndex of face tuples and a counts column, most frequent first.
+        """
+        import pandas as pd
+
+        if tally is None:
+            return pd.DataFrame({'counts': pd.Series(dtype='int64')})
+        if faces is None:
+            faces = self.game._faces
+        keys, counts = tally
+        order = np.argsort(-counts, kind='stable')
+        rows = faces[self._unkeys(keys[order], n_dice, faces)]
+        names = [f'die_{idx}' for idx in range(n_dice)] if named else None
+        index = pd.MultiIndex.from_arrays(list(rows.T), names=names)
+        return pd.DataFrame({'counts': counts[order].astype(np.int64)}, index=index)
+
+    @staticmethod
+    def _jackpots(codes):
+        """
+        Counts jackpots straight on an integer-code array, block by block and die by die.
+
+        Each die is compared with die 0 and the comparison stops early once no roll in the block can still be a jackpot.
+
+        Args:
+        - codes (np.array): integer codes of shape (rolls, number of dice).
+
+        Returns:
+        - Returns the number of jackpots as np.int64.
+        """
+        total = 0
+        for start in range(0, len(codes), _BLOCK_ROLLS):
+            block = codes[start:start + _BLOCK_ROLLS]
+            same = np.ones(len(block), dtype=bool)
+            for col in range(1, block.shape[1]):
+                same &= block[:, col] == block[:, 0]
+                if not same.any():
+                    break
+            total += np.count_nonzero(same)
+        return np.int64(total)
+
+    def _face_counts(self, codes, out=None, faces=None):
+        """
+        Per-roll face counts from one np.bincount per block, with each roll's codes offset into its own row.
+
+        Args:
+        - codes (np.array): integer codes of shape (rolls, number of dice).
+        - out (np.array, optional): (rolls, faces) array to write the counts into.
+        - faces (np.array, optional): face lookup the codes index; defaults to the stored play's.
+
+        Returns:
+        - Returns a dense (rolls, faces) count matrix in the smallest unsigned dtype that holds the number of dice.
+        """
+        n_faces = len(self.game._faces if faces is None else faces)
+        counts = out if out is not None else np.empty((len(codes), n_faces), dtype=np.min_scalar_type(codes.shape[1]))
+        ##keep the int64 bincount temporary around 32MB
+        step = max(1, (1 << 22) // n_faces)
+        for start in range(0, len(codes), step):
+            block = codes[start:start + step]
+            keys = block + np.arange(len(block))[:, None] * n_faces
+            counts[start:start + len(block)] = np.bincount(keys.ravel(), minlength=len(block) * n_faces).reshape(len(block), n_faces)
+        return counts
+
     ##jackpot method
-    def jackpot(self):
+    @_timed('Analyzer.jackpot', _analyzer_rows)
+    @_memoized
+    def jackpot(self, chunks=None):
         """
         A jackpot is a result in which all faces are the same, e.g. all ones for a six-sided die.
 
         Args:
         - Computes how many times the game resulted in a jackpot.
+        - chunks (iterable, optional): integer-code chunks from Game.play_stream to count instead of the stored play.
 
         Returns:
         -Returns an integer for the number of jackpots.
         """
-        return self.game.play_results().eq(self.game.play_results().iloc[:, 0], axis=0).all(1).sum()
+        if chunks is None and self.incremental:
+            self._update()
+            return self._tallies['jackpot']
+        if chunks is None:
+            chunks = self._stored_chunks()
+        return np.int64(sum(self._map(self._jackpots, self._partitions(chunks))))
     
     ##facecounts method
-    def rolled_event(self):
+    @_timed('Analyzer.rolled_event', _analyzer_rows)
+    @_memoized
+    def rolled_event(self, sparse=False, chunks=None):
         """
         Computes how many times a given face is rolled in each event.
 
         Functions
         The data frame has an index of the roll number, face values as columns, and count values in the cells (i.e. it is in wide format)
+        With sparse, only the nonzero cells are returned, indexed by (roll, face), which suits dice with many faces.
+        With chunks, the per-roll counts are not kept; instead each chunk is folded into a histogram indexed by
+        count (0 to number of dice) with face values as columns, giving how many rolls showed each face that many times.
+
+        Args:
+        - sparse (bool): return only nonzero counts in a (roll, face) indexed data frame; defaults to False.
+        - chunks (iterable, optional): integer-code chunks from Game.play_stream, folded into the count histogram.
 
         Returns:
         -Returns a data frame of results.
         """
-        data = self.game.play_results()
-        counts = data.apply(pd.Series.value_counts)
-        #may need to fix for Nan
-        return counts
+        import pandas as pd
+
+        if chunks is not None:
+            return self._count_histogram(chunks, self._lookup(chunks))
+        codes = self.game._data
+        if codes is None:
+            return pd.DataFrame()
+        faces = pd.Index(self.game._faces)
+        if self.incremental and not sparse:
+            self._update()
+            counts = self._tallies['counts']
+            if not counts:
+                ##no rolls folded in yet, e.g. after play(0)
+                return pd.DataFrame(self._face_counts(codes), columns=faces)
+            if len(counts) > 1:
+                counts[:] = [np.concatenate(counts)]
+            return pd.DataFrame(counts[0], columns=faces)
+        if sparse:
+            n_faces = len(faces)
+            keys = (codes + np.arange(len(codes))[:, None] * n_faces).ravel()
+            keys, counts = np.unique(keys, return_counts=True)
+            rolls, cols = np.divmod(keys, n_faces)
+            index = pd.MultiIndex.from_arrays([rolls, faces[cols]], names=['roll', 'face'])
+            return pd.DataFrame({'counts': counts.astype(np.min_scalar_type(codes.shape[1]))}, index=index)
+        if not self._threaded():
+            return pd.DataFrame(self._face_counts(codes), columns=faces)
+        ##each thread fills its own rows of the count matrix
+        counts = np.empty((len(codes), len(faces)), dtype=np.min_scalar_type(codes.shape[1]))
+        step = self._partition_rows(len(codes))
+
+        def fill(start):
+            self._face_counts(codes[start:start + step], out=counts[start:start + step])
+
+        for _ in self._map(fill, range(0, len(codes), step)):
+            pass
+        return pd.DataFrame(counts, columns=faces)
+
+    def _count_histogram(self, chunks, faces):
+        """
+        Folds per-roll face counts of a stream of chunks into a count histogram.
+
+        Args:
+        - chunks (iterable): integer-code arrays, e.g. from Game.play_stream.
+        - faces (np.array): face lookup the codes index.
+
+        Returns:
+        - Returns a data frame indexed by count with face values as columns and numbers of rolls in the cells.
+        """
+        hist = 0
+        ##without any chunk the width is that of the dice the stream would draw
+        n_dice = len(self.game.dies)
+        parts = self._map(lambda codes: (self._histogram(self._face_counts(codes, faces=faces), codes.shape[1]),
+                                         codes.shape[1]), self._partitions(chunks))
+        for part, n_dice in parts:
+            hist = hist + part
+        return self._histogram_frame(hist, faces, n_dice)
+
+    @staticmethod
+    def _histogram(counts, n_dice):
+        """
+        Counts, for each face, how many rolls showed it 0 to number of dice times.
+
+        Args:
+        - counts (np.array): per-roll face counts from _face_counts.
+        - n_dice (int): number of dice the counts were taken over.
+
+        Returns:
+        - Returns the flattened (faces, number of dice + 1) histogram.
+        """
+        n_faces = counts.shape[1]
+        n_counts = n_dice + 1
+        counts = counts.astype(np.intp) + np.arange(n_faces) * n_counts
+        return np.bincount(counts.ravel(), minlength=n_faces * n_counts)
+
+    @staticmethod
+    def _histogram_frame(hist, faces, n_dice):
+        """
+        Builds the count histogram data frame, indexed by count with face values as columns.
+        """
+        import pandas as pd
+
+        n_faces = len(faces)
+        n_counts = n_dice + 1
+        hist = np.zeros(n_faces * n_counts, dtype=np.int64) + hist
+        return pd.DataFrame(hist.reshape(n_faces, n_counts).T, columns=pd.Index(faces),
+                            index=pd.RangeIndex(n_counts, name='count'))
 
     ##A combo count method
-    def combo_faces(self):
+    @_timed('Analyzer.combo_faces', _analyzer_rows)
+    @_memoized
+    def combo_faces(self, chunks=None):
         """
         Computes the distinct combinations of faces rolled, along with their counts.
 
         Combinations are order-independent and may contain repetitions.
+        Each roll's face codes are sorted, packed into one key and counted with np.unique.
+
+        Args:
+        - chunks (iterable, optional): integer-code chunks from Game.play_stream, counted chunk by chunk and merged.
 
         Returns:
-        -Returns a data frame of results.
+        -Returns a data frame with a MultiIndex of distinct combinations and a counts column.
         """
-        data = self.game.play_results()
-        combos = data.apply(lambda row: tuple(row), axis=1).value_counts()
-        return pd.DataFrame(combos, columns=['counts'])
+        if chunks is None and self.incremental:
+            self._update()
+            return self._tally_frame(self._tallies['combos'], self._stored_dice())
+        faces = self._lookup(chunks)
+        if chunks is None:
+            chunks = self._stored_chunks()
+        return self._count_keys(self._combo_keys, chunks, faces=faces)
     
     ##An permutation count method
-    def distinct_permutations(self):
+    @_timed('Analyzer.distinct_permutations', _analyzer_rows)
+    @_memoized
+    def distinct_permutations(self, chunks=None):
         """
         Computes the distinct permutations of faces rolled, along with their counts.
 
         The data frame should have a MultiIndex of distinct permutations and a column for the associated counts
+        Each roll's face codes are packed into one key, in die order, and counted with np.unique.
+
+        Args:
+        - chunks (iterable, optional): integer-code chunks from Game.play_stream, counted chunk by chunk and merged.
 
         Returns:
-        -Returns a data frame of results.
+        -Returns a data frame with a MultiIndex of face tuples (one level per die) and a counts column.
         """
-        data = self.game.play_results()
-        perms = data.apply(lambda row: ''.join(map(str, row)), axis=1).value_counts()
-        return pd.DataFrame(perms, columns=['counts'])
+        if chunks is None and self.incremental:
+            self._update()
+            return self._tally_frame(self._tallies['perms'], self._stored_dice(), named=True)
+        faces = self._lookup(chunks)
+        if chunks is None:
+            chunks = self._stored_chunks()
+        return self._count_keys(self._keys, chunks, named=True, faces=faces)
+
+    ##all four statistics in one pass
+    @_timed('Analyzer.summary', _analyzer_rows)
+    @_memoized
+    def summary(self, chunks=None):
+        """
+        Computes jackpot, rolled_event, combo_faces and distinct_permutations together in a single pass over the codes.
+
+        Each block is read once: its rows are sorted once for both the jackpots and the combination keys, and the same
+        key packing gives the permutation keys. The keys of each block are counted with np.unique and merged into the
+        running tallies straight away, so only the distinct keys are held, never one key per roll.
+
+        Args:
+        - chunks (iterable, optional): integer-code chunks from Game.play_stream; rolled_event is then the count histogram
+          and the key counts are merged chunk by chunk, as for the single statistics.
+
+        Returns:
+        - Returns a dict of the four results, keyed by method name.
+        """
+        import pandas as pd
+
+        streamed = chunks is not None
+        faces = self._lookup(chunks)
+        if not streamed:
+            codes = self.game._data
+            if codes is None:
+                empty = pd.DataFrame({'counts': pd.Series(dtype='int64')})
+                return {'jackpot': np.int64(0), 'rolled_event': pd.DataFrame(),
+                        'combo_faces': empty, 'distinct_permutations': empty.copy()}
+            step = min(1 << 19, self._partition_rows(len(codes)))
+            blocks = ((start, codes[start:start + step]) for start in range(0, len(codes), step))
+            counts = np.empty((len(codes), len(faces)), dtype=np.min_scalar_type(codes.shape[1]))
+            n_dice = codes.shape[1]
+        else:
+            blocks = ((None, block) for block in self._partitions(chunks))
+            ##without any chunk the width is that of the dice the stream would draw
+            n_dice = len(self.game.dies)
+
+        def scan(item):
+            start, block = item
+            ordered = np.sort(block, axis=1)
+            jackpots = np.count_nonzero(ordered[:, 0] == ordered[:, -1])
+            if streamed:
+                hist = self._histogram(self._face_counts(block, faces=faces), block.shape[1])
+            else:
+                hist = 0
+                self._face_counts(block, out=counts[start:start + len(block)])
+            combo = np.unique(self._keys(ordered, faces), return_counts=True)
+            perm = np.unique(self._keys(block, faces), return_counts=True)
+            return jackpots, hist, combo, perm, block.shape[1]
+
+        jackpots = hist = 0
+        combos = perms = None
+        for part_jackpots, part_hist, combo, perm, n_dice in self._map(scan, blocks):
+            jackpots += part_jackpots
+            hist = hist + part_hist
+            combos = self._merge_tallies(combos, combo)
+            perms = self._merge_tallies(perms, perm)
+        if not streamed:
+            rolled = pd.DataFrame(counts, columns=pd.Index(faces))
+        else:
+            rolled = self._histogram_frame(hist, faces, n_dice)
+        return {
+            'jackpot': np.int64(jackpots),
+            'rolled_event': rolled,
+            'combo_faces': self._tally_frame(combos, n_dice, faces=faces),
+            'distinct_permutations': self._tally_frame(perms, n_dice, named=True, faces=faces),
+        }
+
+    ##adaptive precision run
+    def estimate(self, rel_tol=None, abs_tol=None, confidence=0.95, batch=_BLOCK_ROLLS, max_rolls=None, max_time=None, seed=None):
+        """
+        Plays the game in batches, keeping running estimates of the jackpot rate and the per-face frequencies with their
+        standard errors, and stops once every confidence interval is tight enough or a budget runs out.
+
+        The batches are streamed, nothing is stored on the game. The standard errors are floored by the Agresti-Coull
+        error of the count behind each rate, so an event that has not been seen yet (a rare jackpot) keeps a non-zero
+        error and never meets rel_tol. Rates the dice make impossible (a face of zero weight, a jackpot of dice with no
+        face in common) are known to be exactly 0: their stderr is 0 and they are left out of the rel_tol test.
+        A rare but possible event can still keep rel_tol out of reach, so rel_tol alone needs a budget.
+
+        Args:
+        - rel_tol (float, optional): stop when every interval half-width is within rel_tol times its estimate.
+        - abs_tol (float, optional): stop when every interval half-width is within abs_tol.
+        - confidence (float): confidence level of the intervals; defaults to 0.95.
+        - batch (int): rolls per batch; defaults to one block.
+        - max_rolls (int, optional): roll budget.
+        - max_time (float, optional): time budget in seconds, checked after each batch.
+        - seed (int or SeedSequence, optional): seed of the run; defaults to a new stream spawned from the game's seed.
+
+        Returns:
+        - Returns a dict with the rolls used, the seconds taken, whether the precision was reached, the jackpot rate
+          (pd.Series of estimate and stderr) and the face frequencies (data frame of estimate and stderr, indexed by face).
+
+        Raises:
+        - ValueError: if no precision and no budget is given, if rel_tol is given without abs_tol or a budget, or if
+          batch or max_rolls is below 1.
+        """
+        import pandas as pd
+
+        if rel_tol is None and abs_tol is None and max_rolls is None and max_time is None:
+            raise ValueError("Give a precision or a budget to stop at!!")
+        if rel_tol is not None and abs_tol is None and max_rolls is None and max_time is None:
+            raise ValueError("rel_tol alone may never be met, give max_rolls or max_time too!!")
+        if batch < 1:
+            raise ValueError("batch must be at least 1!!")
+        if max_rolls is not None and max_rolls < 1:
+            raise ValueError("max_rolls must be at least 1!!")
+        from statistics import NormalDist
 
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        root = _seed_sequence(seed) if seed is not None else self.game._seed.spawn(1)[0]
+        n_dice = len(self.game.dies)
+        ##the batches are drawn against the dice's current face lookup, not the stored play's
+        faces, probs = self.game._probabilities()
+        ##rates that can be non-zero at all: a jackpot needs a face every die can show, a face some die that shows it
+        possible = np.concatenate([[(probs > 0).all(axis=0).any()], (probs > 0).any(axis=0)])
+        rolls = jackpots = 0
+        sums = squares = 0.0
+        converged = False
+        started = time.perf_counter()
+        while True:
+            size = batch if max_rolls is None else min(batch, max_rolls - rolls)
+            for codes in self.game.play_stream(size, chunk_size=size, seed=root.spawn(1)[0]):
+                jackpots += self._jackpots(codes)
+                shares = self._face_counts(codes, faces=faces) / n_dice
+                sums = sums + shares.sum(axis=0)
+                squares = squares + (shares ** 2).sum(axis=0)
+            rolls += size
+            means = np.concatenate([[jackpots / rolls], sums / rolls])
+            variances = np.concatenate([[means[0] * (1 - means[0])], np.maximum(squares / rolls - (sums / rolls) ** 2, 0)])
+            ##Agresti-Coull floor: the jackpot count is out of the rolls, the face counts out of every die's draws
+            trials = np.concatenate([[rolls], np.full(len(faces), rolls * n_dice)])
+            shifted = (means * trials + z ** 2 / 2) / (trials + z ** 2)
+            stderr = np.maximum(np.sqrt(variances / rolls), np.sqrt(shifted * (1 - shifted) / (trials + z ** 2)))
+            stderr[~possible] = 0
+            if rel_tol is not None or abs_tol is not None:
+                converged = ((abs_tol is None or np.all(z * stderr <= abs_tol))
+                             and (rel_tol is None or np.all((z * stderr <= rel_tol * np.abs(means))[possible])))
+            if (converged or (max_rolls is not None and rolls >= max_rolls)
+                    or (max_time is not None and time.perf_counter() - started >= max_time)):
+                break
+        return {
+            'rolls': rolls,
+            'seconds': time.perf_counter() - started,
+            'converged': converged,
+            'jackpot': pd.Series({'estimate': means[0], 'stderr': stderr[0]}),
+            'faces': pd.DataFrame({'estimate': means[1:], 'stderr': stderr[1:]}, index=pd.Index(faces, name='face')),
+        }
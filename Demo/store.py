@@ -0,0 +1,128 @@
+import json
+
+import numpy as np
+
+from .montecarlo import Die, Game, _BLOCK_ROLLS, _seed_sequence
+
+
+def _seed_spec(seed):
+    """
+    A SeedSequence as JSON: its entropy and spawn key, which together give back the same streams.
+    """
+    return {'entropy': seed.entropy, 'spawn_key': list(seed.spawn_key)}
+
+
+def _seed_from(spec):
+    """
+    Rebuilds a SeedSequence written by _seed_spec.
+    """
+    return np.random.SeedSequence(spec['entropy'], spawn_key=spec['spawn_key'])
+
+
+def _header(game, rolls, faces, plays):
+    """
+    Metadata needed to rebuild a game around its stored codes.
+
+    Args:
+    - game (Game): game whose results are stored.
+    - rolls (int): number of stored rolls.
+    - faces (np.array): face lookup the stored codes index.
+    - plays (list): (root SeedSequence, rolls) of each play in the stored codes, in roll order.
+
+    Returns:
+    - Returns a JSON-serializable dict of the faces, each die's faces and weights, the game's seed, the seed and rolls
+      of every stored play, which replay the stored codes exactly, and the shape.
+    """
+    return {
+        'faces': faces.tolist(),
+        'dice': [{'faces': die._faces.tolist(), 'weights': die._weights.tolist()} for die in game.dies],
+        'game_seed': _seed_spec(game._seed),
+        'plays': [dict(_seed_spec(seed), rolls=count) for seed, count in plays],
+        'rolls': rolls,
+    }
+
+
+def _write_header(path, header):
+    """
+    Writes the header next to the codes, at path + '.json'.
+    """
+    with open(f'{path}.json', 'w') as file:
+        json.dump(header, file)
+
+
+##save the results of the most recent play
+def save_results(game, path):
+    """
+    Saves the integer codes of a game's most recent play as a raw .npy array plus a small JSON header at path + '.json'.
+
+    Args:
+    - game (Game): a game that has been played.
+    - path (str): file to write the codes to.
+
+    Raises:
+    - ValueError: if the game has not been played.
+    """
+    if game._data is None:
+        raise ValueError("Game has not been played!!")
+    codes = np.lib.format.open_memmap(path, mode='w+', dtype=game._data.dtype, shape=game._data.shape)
+    codes[:] = game._data
+    codes.flush()
+    _write_header(path, _header(game, len(codes), game._faces, game._plays))
+
+
+##play straight to disk
+def save_stream(game, path, rolls, chunk_size=_BLOCK_ROLLS, seed=None):
+    """
+    Plays a game chunk by chunk straight into a memory-mapped file, so the results never have to fit in memory.
+
+    Args:
+    - game (Game): game to play.
+    - path (str): file to write the codes to.
+    - rolls (int): total number of rolls.
+    - chunk_size (int): rolls per chunk; defaults to one block.
+    - seed (int or SeedSequence, optional): seed for this play, as for Game.play.
+    """
+    ##the stream draws against the dice's current face lookup
+    faces = game._face_lookup()[0]
+    root = _seed_sequence(seed) if seed is not None else game._seed.spawn(1)[0]
+    chunks = game.play_stream(rolls, chunk_size=chunk_size, seed=root)
+    codes = None
+    start = 0
+    for chunk in chunks:
+        if codes is None:
+            codes = np.lib.format.open_memmap(path, mode='w+', dtype=chunk.dtype, shape=(rolls, len(game.dies)))
+        codes[start:start + len(chunk)] = chunk
+        start += len(chunk)
+    if codes is None:
+        codes = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=(0, len(game.dies)))
+    codes.flush()
+    _write_header(path, _header(game, rolls, faces, [(root, rolls)]))
+
+
+##reopen stored results
+def open_results(path):
+    """
+    Reopens stored results as a Game whose codes are a read-only np.memmap of the file.
+
+    play_results and every Analyzer method work on the returned game. jackpot, combo_faces, distinct_permutations and
+    the tallies of summary read the file block by block in bounded memory; the per-roll rolled_event (and summary's copy
+    of it) is a result as large as the play and is built in memory, rolled_event(chunks=...) gives the count histogram.
+
+    Args:
+    - path (str): file written by save_results or save_stream.
+
+    Returns:
+    - Returns a Game rebuilt from the header, with the stored codes as its most recent play.
+    """
+    with open(f'{path}.json') as file:
+        header = json.load(file)
+    dies = []
+    for spec in header['dice']:
+        die = Die(np.array(spec['faces']))
+        die.set_weights(spec['weights'])
+        dies.append(die)
+    game = Game(dies, seed=_seed_from(header['game_seed']))
+    game._faces = np.array(header['faces'])
+    game._data = np.load(path, mmap_mode='r')
+    game._plays = [(_seed_from(spec), spec['rolls']) for spec in header['plays']]
+    return game
@@ -0,0 +1,178 @@
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from .montecarlo import Die, Game, Analyzer
+
+##the word list and letter frequencies ship inside the package, see package_data in setup.py
+_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+LETTERS_PATH = os.path.join(_DATA, 'english_letters.txt')
+WORDS_PATH = os.path.join(_DATA, 'scrabble_words.txt')
+
+##longest word that still packs into an int64 in base 26
+_MAX_PACKED = 13
+
+
+def _pack(letters):
+    """
+    Packs rows of letter numbers (A=0 ... Z=25) into sortable keys, base-26 int64 up to 13 letters, fixed-width bytes above.
+
+    Args:
+    - letters (np.array): uint8 array of shape (words, length).
+
+    Returns:
+    - Returns a 1-d array with one key per row.
+    """
+    letters = np.ascontiguousarray(letters, dtype=np.uint8)
+    if letters.shape[1] > _MAX_PACKED:
+        return letters.view(f'S{letters.shape[1]}').ravel()
+    keys = np.zeros(len(letters), dtype=np.int64)
+    for col in range(letters.shape[1]):
+        keys *= 26
+        keys += letters[:, col]
+    return keys
+
+
+def _letter_numbers(faces):
+    """
+    Letter numbers (A=0 ... Z=25) of an array of faces, 255 for anything that is not a single letter.
+    """
+    numbers = np.full(len(faces), 255, dtype=np.uint8)
+    for idx, face in enumerate(faces):
+        face = str(face).upper()
+        if len(face) == 1 and 'A' <= face <= 'Z':
+            numbers[idx] = ord(face) - ord('A')
+    return numbers
+
+
+class WordIndex:
+    """
+    A compact word lookup: for each word length, a sorted array of packed word keys.
+
+    Attributes:
+    - _keys (dict): sorted key array per word length.
+    """
+    def __init__(self, path=WORDS_PATH):
+        """
+        Loads a word list, one word per line, into sorted packed keys.
+
+        Args:
+        - path (str): word list; defaults to the packaged scrabble_words.txt.
+        """
+        with open(path) as file:
+            words = np.array(file.read().upper().split())
+        lengths = np.char.str_len(words)
+        self._keys = {}
+        for length in np.unique(lengths):
+            group = words[lengths == length].astype(f'S{length}')
+            letters = group.view(np.uint8).reshape(-1, length) - ord('A')
+            self._keys[int(length)] = np.unique(_pack(letters))
+
+    def __len__(self):
+        """
+        Number of distinct words in the index.
+        """
+        return sum(len(keys) for keys in self._keys.values())
+
+    def contains(self, letters):
+        """
+        Vectorized membership test for rows of letter numbers.
+
+        Args:
+        - letters (np.array): uint8 array of shape (candidates, length) with A=0 ... Z=25, 255 for non-letters.
+
+        Returns:
+        - Returns a boolean array, True where the row spells a word.
+        """
+        letters = np.asarray(letters)
+        found = np.zeros(len(letters), dtype=bool)
+        keys = self._keys.get(letters.shape[1])
+        if keys is None or not len(letters):
+            return found
+        valid = (letters < 26).all(axis=1)
+        candidates = _pack(letters[valid])
+        spots = np.minimum(np.searchsorted(keys, candidates), len(keys) - 1)
+        found[valid] = keys[spots] == candidates
+        return found
+
+
+##load the Scrabble word list only once
+@lru_cache(maxsize=None)
+def word_index(path=WORDS_PATH):
+    """
+    The WordIndex of a word list, built on first use and shared afterwards.
+
+    Args:
+    - path (str): word list; defaults to the packaged scrabble_words.txt.
+
+    Returns:
+    - Returns the WordIndex.
+    """
+    return WordIndex(path)
+
+
+def letter_die(path=LETTERS_PATH, seed=None):
+    """
+    Builds a letter die weighted by letter frequencies, one 'letter count' pair per line.
+
+    Args:
+    - path (str): frequency file; defaults to the packaged english_letters.txt.
+    - seed (int, optional): seed of the die's own random stream.
+
+    Returns:
+    - Returns the Die.
+    """
+    with open(path) as file:
+        pairs = [line.split() for line in file if line.strip()]
+    die = Die(np.array([letter for letter, _ in pairs]), seed=seed)
+    die.set_weights([float(count) for _, count in pairs])
+    return die
+
+
+##count permutations that are words
+def count_words(analyzer, index=None):
+    """
+    Checks which of a game's distinct permutations spell a word, all at once on the permutation index codes.
+
+    Args:
+    - analyzer (Analyzer): analyzer of a played letter game.
+    - index (WordIndex, optional): word lookup; defaults to the Scrabble words.
+
+    Returns:
+    - Returns a dict with the number of distinct permutations, how many of them are words, the rolls that spelled a word,
+      and the word permutations themselves as a data frame of counts.
+    """
+    if index is None:
+        index = word_index()
+    perms = analyzer.distinct_permutations()
+    if not len(perms):
+        return {'permutations': 0, 'words': 0, 'rolls': 0, 'found': perms}
+    columns = [_letter_numbers(level)[codes] for level, codes in zip(perms.index.levels, perms.index.codes)]
+    found = index.contains(np.column_stack(columns))
+    return {
+        'permutations': len(perms),
+        'words': int(found.sum()),
+        'rolls': int(perms['counts'][found].sum()),
+        'found': perms[found],
+    }
+
+
+def simulate_words(n_dice, rolls, seed=None, workers=None, index=None):
+    """
+    Rolls n_dice letter dice weighted by English letter frequencies and counts the permutations that are words.
+
+    Args:
+    - n_dice (int): number of letter dice, the length of the words.
+    - rolls (int): number of rolls.
+    - seed (int, optional): seed of the play.
+    - workers (int, optional): worker processes for Game.play.
+    - index (WordIndex, optional): word lookup; defaults to the Scrabble words.
+
+    Returns:
+    - Returns the dict of count_words.
+    """
+    die = letter_die()
+    game = Game([die] * n_dice, seed=seed)
+    game.play(rolls, workers=workers)
+    return count_words(Analyzer(game), index)
@@ -0,0 +1,71 @@
+"""
+Import-time benchmark for the NumPy-only core.
+
+Every run starts a fresh interpreter, imports a module, rolls a die and plays a game through the ndarray path,
+and reports the import time and whether pandas got loaded along the way.
+The core modules must not load pandas; the check fails if they do or if an import is slower than --max-seconds.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 --max-seconds 0.5
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+##modules that must import and play without pandas
+CORE = ['Demo', 'Demo.montecarlo', 'Demo.store', 'Demo.words']
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - started
+import numpy as np
+from Demo.montecarlo import Die, Game
+die = Die(np.arange(6))
+die.roll(10, as_array=True)
+game = Game([die, die], seed=0)
+game.play(1000)
+game.play_results(form='array')
+print(json.dumps({{'seconds': seconds, 'pandas': 'pandas' in sys.modules}}))
+"""
+
+
+def probe(module):
+    """
+    Imports module and plays the core path in a fresh interpreter.
+
+    Returns:
+    - Returns a dict with the import time in seconds and whether pandas was loaded.
+    """
+    output = subprocess.run([sys.executable, '-c', PROBE.format(module=module)], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='*', default=CORE, help='modules to import')
+    parser.add_argument('--repeat', type=int, default=5, help='fresh interpreters per module, the best time is kept')
+    parser.add_argument('--max-seconds', type=float, default=None, help='flag imports slower than this')
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(f"{'module':<20}{'seconds':>10}{'pandas':>8}")
+    for module in args.modules:
+        runs = [probe(module) for _ in range(args.repeat)]
+        seconds = min(run['seconds'] for run in runs)
+        pandas = any(run['pandas'] for run in runs)
+        slow = args.max_seconds is not None and seconds > args.max_seconds
+        failures += pandas or slow
+        print(f"{module:<20}{seconds:>10.4f}{str(pandas):>8}{'  SLOW' if slow else ''}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Benchmarks for the Die, Game and Analyzer hot paths.
+
+Every case is run on a fixed seed and records wall time, throughput (rolls per second) and peak traced memory.
+Results are printed as a table and can be saved as JSON and compared against an earlier run to catch regressions.
+
+Usage:
+    python benchmarks/bench_montecarlo.py                      # quick matrix
+    python benchmarks/bench_montecarlo.py --full               # full matrix, skipping cases over --max-cells
+    python benchmarks/bench_montecarlo.py --save base.json
+    python benchmarks/bench_montecarlo.py --compare base.json  # flags cases more than --tolerance slower
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from Demo.montecarlo import Die, Game, Analyzer  # noqa: E402
+
+LETTERS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Demo', 'data', 'english_letters.txt')
+
+QUICK = {'dice': [1, 5, 20], 'faces': [2, 6, 100], 'rolls': [10**3, 10**5], 'weights': ['uniform', 'skewed']}
+FULL = {'dice': [1, 2, 5, 10, 50, 100], 'faces': [2, 6, 26, 100, 1000, 10000],
+        'rolls': [10**3, 10**4, 10**5, 10**6, 10**7, 10**8], 'weights': ['uniform', 'skewed']}
+
+ANALYZER_METHODS = ['jackpot', 'rolled_event', 'combo_faces', 'distinct_permutations', 'summary']
+
+
+def make_die(faces, weights, seed=0):
+    """
+    Builds a die with the given number of faces, uniform or with Zipf-like skewed weights.
+    """
+    die = Die(np.arange(faces), seed=seed)
+    if weights == 'skewed':
+        die.set_weights(1.0 / np.arange(1, faces + 1))
+    return die
+
+
+def letter_die(seed=0):
+    """
+    Builds the 26-letter die weighted by Demo/data/english_letters.txt.
+    """
+    with open(LETTERS) as file:
+        frequencies = [line.split() for line in file if line.strip()]
+    die = Die(np.array([letter for letter, _ in frequencies]), seed=seed)
+    die.set_weights([float(count) for _, count in frequencies])
+    return die
+
+
+def measure(func, repeat=1):
+    """
+    Times func, best of repeat runs, and measures its peak memory in one extra run under tracemalloc.
+
+    Returns:
+    - Returns the wall time in seconds and the peak traced memory in bytes.
+    """
+    seconds = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        seconds = min(seconds, time.perf_counter() - started)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def run_case(name, die, n_dice, rolls, methods, repeat=1):
+    """
+    Benchmarks Die.roll, Game.play and the Analyzer methods for one configuration.
+
+    Returns:
+    - Returns a list of result dicts, one per measured call.
+    """
+    results = []
+
+    def record(target, func, count):
+        seconds, peak = measure(func, repeat)
+        results.append({'case': name, 'target': target, 'dice': n_dice, 'rolls': rolls, 'seconds': seconds,
+                        'rolls_per_second': count / seconds if seconds else float('inf'), 'peak_bytes': peak})
+
+    record('Die.roll', lambda: die.roll(rolls), rolls)
+    game = Game([die] * n_dice, seed=0)
+    record('Game.play', lambda: game.play(rolls, seed=0), rolls)
+    record('Game.play_results', game.play_results, rolls)
+    for method in methods:
+        analyzer = Analyzer(game, cache_size=0)
+        record(f'Analyzer.{method}', getattr(analyzer, method), rolls)
+    return results
+
+
+def cases(matrix, max_cells):
+    """
+    Yields (name, die, dice, rolls) for every configuration in the matrix with at most max_cells outcomes.
+    """
+    for n_dice, faces, rolls, weights in itertools.product(matrix['dice'], matrix['faces'], matrix['rolls'], matrix['weights']):
+        if n_dice * rolls > max_cells or faces * rolls > max_cells:
+            continue
+        yield f'{weights}-{faces}f', make_die(faces, weights), n_dice, rolls
+    for n_dice, rolls in itertools.product([4, 5], matrix['rolls']):
+        if n_dice * rolls <= max_cells:
+            yield 'letters', letter_die(), n_dice, rolls
+
+
+def compare(results, path, tolerance, min_seconds):
+    """
+    Prints the cases that got slower than in a saved run by more than tolerance (a fraction),
+    ignoring cases faster than min_seconds, which are mostly timer noise.
+
+    Returns:
+    - Returns the number of regressions.
+    """
+    with open(path) as file:
+        baseline = {(row['case'], row['target'], row['dice'], row['rolls']): row for row in json.load(file)}
+    regressions = 0
+    for row in results:
+        old = baseline.get((row['case'], row['target'], row['dice'], row['rolls']))
+        if old and row['seconds'] > max(old['seconds'] * (1 + tolerance), min_seconds):
+            regressions += 1
+            print(f"REGRESSION {row['case']} {row['target']} dice={row['dice']} rolls={row['rolls']}: "
+                  f"{old['seconds']:.4f}s -> {row['seconds']:.4f}s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--full', action='store_true', help='run the full dice x faces x rolls x weights matrix')
+    parser.add_argument('--max-cells', type=float, default=2e8,
+                        help='skip cases whose results or per-roll counts would exceed this many cells')
+    parser.add_argument('--methods', nargs='*', default=ANALYZER_METHODS, help='Analyzer methods to time')
+    parser.add_argument('--save', help='write the results as JSON')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown before a case is flagged')
+    parser.add_argument('--min-seconds', type=float, default=0.01, help='never flag cases faster than this')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case, the best one is kept')
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'case':<16}{'target':<34}{'dice':>6}{'rolls':>12}{'seconds':>10}{'rolls/s':>14}{'peak MB':>10}")
+    for name, die, n_dice, rolls in cases(FULL if args.full else QUICK, args.max_cells):
+        for row in run_case(name, die, n_dice, rolls, args.methods, args.repeat):
+            results.append(row)
+            print(f"{row['case']:<16}{row['target']:<34}{row['dice']:>6}{row['rolls']:>12}{row['seconds']:>10.4f}"
+                  f"{row['rolls_per_second']:>14.3g}{row['peak_bytes'] / 2**20:>10.1f}")
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=1)
+    if args.compare:
+        return 1 if compare(results, args.compare, args.tolerance, args.min_seconds) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
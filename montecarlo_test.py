@@ -1,8 +1,19 @@
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 import pandas as pd
 import numpy as np
 
 from Demo.montecarlo import Die, Game, Analyzer
+from Demo.exact import ExactAnalyzer
+from Demo.store import save_results, save_stream, open_results
+from Demo import cli, columnar
+from Demo.instrument import profile, add_hook, remove_hook
+from Demo.words import WordIndex, count_words, letter_die
 
 class TestDieMethods(unittest.TestCase):
     def test_init_die(self):
@@ -15,6 +26,27 @@ class TestDieMethods(unittest.TestCase):
         die = Die(test_faces)
         die.change_weight(1, 2.5)
         self.assertEqual(die.current_state().loc[1, 'weights'], 2.5)
+
+    def test_set_weights(self):
+        die = Die(np.array(['a', 'b', 'c']))
+        die.set_weights([1, 2, 3])
+        self.assertEqual(die.current_state()['weights'].tolist(), [1.0, 2.0, 3.0])
+        die.set_weights({'b': 0})
+        die.set_weights(pd.Series([5.0], index=['c']))
+        self.assertEqual(die.current_state()['weights'].tolist(), [1.0, 0.0, 5.0])
+        self.assertNotIn('b', die.roll(50))
+        with self.assertRaises(IndexError):
+            die.set_weights({'z': 1})
+        with self.assertRaises(ValueError):
+            die.set_weights([1, 2])
+
+    def test_change_weight_resets_alias(self):
+        test_faces = np.array([1, 2, 3])
+        die = Die(test_faces)
+        die.roll(5)
+        die.change_weight(1, 0)
+        die.change_weight(2, 0)
+        self.assertEqual(set(die.roll(50)), {3})
         
     def test_roll(self):
         test_faces = np.array([1, 2, 3, 4, 5, 6])
@@ -22,6 +54,10 @@ class TestDieMethods(unittest.TestCase):
         outcomes = die.roll(10)
         self.assertEqual(len(outcomes), 10)
         
+    def test_roll_seed(self):
+        test_faces = np.array([1, 2, 3, 4, 5, 6])
+        self.assertEqual(Die(test_faces, seed=7).roll(20), Die(test_faces, seed=7).roll(20))
+
     def test_current_state(self):
         test_faces = np.array([1, 2, 3, 4, 5, 6])
         die = Die(test_faces)
@@ -53,7 +89,143 @@ class TestGameMethods(unittest.TestCase):
         results = game.play_results()
         self.assertIsInstance(results, pd.DataFrame)
 
+    def test_play_results_array(self):
+        die = Die(np.array(['a', 'b', 'c']))
+        self.assertIsInstance(die.roll(4, as_array=True), np.ndarray)
+        game = Game([die, die], seed=2)
+        game.play(5)
+        outcomes = game.play_results(form='array')
+        self.assertIsInstance(outcomes, np.ndarray)
+        np.testing.assert_array_equal(outcomes, game.play_results().to_numpy())
+
+    def test_core_without_pandas(self):
+        code = ("import sys, numpy as np\n"
+                "from Demo.montecarlo import Die, Game\n"
+                "game = Game([Die(np.arange(6))] * 2)\n"
+                "game.play(10)\n"
+                "game.play_results(form='array')\n"
+                "print('pandas' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), 'False')
+
+    def test_play_codes(self):
+        test_faces = np.array(['a', 'b', 'c'])
+        die1 = Die(test_faces)
+        die2 = Die(test_faces)
+        game = Game([die1, die2])
+        game.play(7)
+        self.assertEqual(game._data.shape, (7, 2))
+        self.assertTrue(np.issubdtype(game._data.dtype, np.integer))
+        self.assertTrue(game.play_results().isin(['a', 'b', 'c']).all().all())
+
+    def test_play_compact_codes(self):
+        game = Game([Die(np.array(list('abcdef')))] * 3)
+        game.play(10)
+        self.assertEqual(game._data.dtype, np.uint8)
+        game = Game([Die(np.arange(300))] * 3)
+        game.play(10)
+        self.assertEqual(game._data.dtype, np.uint16)
+        self.assertEqual(game.play_results().dtypes.iloc[0], np.int64)
+
+    def test_play_mixed_dice(self):
+        die1 = Die(np.array([1, 2, 3]))
+        die1.change_weight(2, 0)
+        die2 = Die(np.array([3, 4, 5]))
+        die2.change_weight(5, 0)
+        game = Game([die1, die2], seed=4)
+        game.play(5000)
+        results = game.play_results()
+        self.assertEqual(set(results['die_0']), {1, 3})
+        self.assertEqual(set(results['die_1']), {3, 4})
+
+    def test_play_seed(self):
+        test_faces = np.array([1, 2, 3, 4, 5, 6])
+        die1 = Die(test_faces)
+        die2 = Die(test_faces)
+        die2.change_weight(6, 4)
+        first = Game([die1, die2], seed=11)
+        second = Game([die1, die2], seed=11)
+        first.play(100)
+        second.play(100)
+        pd.testing.assert_frame_equal(first.play_results(), second.play_results())
+        first.play(100, seed=3)
+        second.play(100, seed=3)
+        pd.testing.assert_frame_equal(first.play_results(), second.play_results())
+
+    def test_play_workers(self):
+        test_faces = np.array([1, 2, 3, 4, 5, 6])
+        die1 = Die(test_faces)
+        die2 = Die(test_faces)
+        die2.change_weight(6, 4)
+        game = Game([die1, die2])
+        game.play(150000, seed=5)
+        serial = game.play_results()
+        game.play(150000, seed=5, workers=3)
+        pd.testing.assert_frame_equal(serial, game.play_results())
+
+    def test_play_stream(self):
+        test_faces = np.array([1, 2, 3, 4, 5, 6])
+        die1 = Die(test_faces)
+        die2 = Die(test_faces)
+        game = Game([die1, die2])
+        chunks = list(game.play_stream(100, chunk_size=30, seed=9))
+        self.assertEqual([len(chunk) for chunk in chunks], [30, 30, 30, 10])
+        game.play(100, seed=9)
+        np.testing.assert_array_equal(np.concatenate(chunks), game._data)
+        rolls = 3 * (1 << 16) + 5
+        game.play(rolls, seed=2)
+        for chunk_size in [1000, (1 << 16) + 1, 1 << 20]:
+            chunks = list(game.play_stream(rolls, chunk_size=chunk_size, seed=2))
+            self.assertTrue(all(len(chunk) == chunk_size for chunk in chunks[:-1]))
+            np.testing.assert_array_equal(np.concatenate(chunks), game._data)
+        with self.assertRaises(ValueError):
+            next(game.play_stream(10, chunk_size=0))
+
+    def test_play_append(self):
+        game = Game([Die(np.array([1, 2, 3]))] * 2)
+        game.play(10, seed=1)
+        first = game._data.copy()
+        parts = [first]
+        for seed in range(2, 7):
+            game.play(10, seed=seed, append=True)
+            parts.append(game._data[-10:].copy())
+        np.testing.assert_array_equal(game._data[:10], first)
+        np.testing.assert_array_equal(game._data, np.concatenate(parts))
+        self.assertGreater(len(game._buffer), len(game._data))
+        game.dies = [Die(np.array([1, 2, 4]))] * 2
+        with self.assertRaises(ValueError):
+            game.play(10, append=True)
+        self.assertEqual(len(game.play_results()), 60)
+
+    def test_play_stream_keeps_stored_faces(self):
+        game = Game([Die(np.array([1, 2, 3]))] * 2)
+        game.play(50, seed=1)
+        stored = game.play_results()
+        game.dies = [Die(np.array([9, 8, 7]))] * 2
+        chunks = list(game.play_stream(50, seed=1))
+        pd.testing.assert_frame_equal(game.play_results(), stored)
+        self.assertEqual(set(Analyzer(game).rolled_event().columns), {1, 2, 3})
+        self.assertEqual(set(Analyzer(game).rolled_event(chunks=chunks).columns), {7, 8, 9})
+
 class TestAnalyzerMethods(unittest.TestCase):
+    def test_stored_dice_count(self):
+        game = Game([Die(np.array([1, 2, 3]))] * 2)
+        game.play(50, seed=1)
+        expected = Analyzer(game).distinct_permutations()
+        game.dies = [Die(np.array([1, 2, 3]))] * 3
+        for analyzer in [Analyzer(game), Analyzer(game, incremental=True)]:
+            pd.testing.assert_frame_equal(analyzer.distinct_permutations(), expected)
+            self.assertEqual(analyzer.combo_faces().index.nlevels, 2)
+            summary = analyzer.summary()
+            pd.testing.assert_frame_equal(summary['distinct_permutations'], expected)
+            self.assertEqual(summary['combo_faces'].index.nlevels, 2)
+        chunks = list(Game([Die(np.array([1, 2, 3]))] * 2).play_stream(50, seed=1))
+        analyzer = Analyzer(game)
+        pd.testing.assert_frame_equal(analyzer.distinct_permutations(chunks=chunks), expected)
+        self.assertEqual(len(analyzer.rolled_event(chunks=chunks)), 3)
+        self.assertEqual(len(analyzer.summary(chunks=chunks)['rolled_event']), 3)
+
     def test_analyzer(self):
         test_faces = np.array([1, 2, 3, 4, 5, 6])
         die1 = Die(test_faces)
@@ -71,6 +243,13 @@ class TestAnalyzerMethods(unittest.TestCase):
         game.play(5)
         analyzer = Analyzer(game)
         self.assertEqual(type(analyzer.jackpot()), np.int64)
+
+    def test_jackpot_count(self):
+        game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])
+        game.play(200, seed=2)
+        analyzer = Analyzer(game)
+        results = game.play_results()
+        self.assertEqual(analyzer.jackpot(), (results.nunique(axis=1) == 1).sum())
  
     def test_combo_faces(self):
         test_faces = np.array([1, 2, 3, 4, 5, 6])
@@ -81,6 +260,16 @@ class TestAnalyzerMethods(unittest.TestCase):
         analyzer = Analyzer(game)
         combos = analyzer.combo_faces()
         self.assertIsInstance(combos, pd.DataFrame)
+
+    def test_combo_faces_order_independent(self):
+        game = Game([Die(np.array([1, 2, 3])) for _ in range(3)])
+        game.play(300, seed=8)
+        combos = Analyzer(game).combo_faces()
+        self.assertIsInstance(combos.index, pd.MultiIndex)
+        self.assertEqual(combos['counts'].sum(), 300)
+        self.assertTrue(all(list(combo) == sorted(combo) for combo in combos.index))
+        expected = game.play_results().apply(lambda row: tuple(sorted(row)), axis=1).value_counts()
+        self.assertEqual(combos['counts'].to_dict(), expected.to_dict())
         
     def test_rolled_event(self):
         test_faces = np.array([1, 2, 3, 4, 5, 6])
@@ -91,6 +280,21 @@ class TestAnalyzerMethods(unittest.TestCase):
         analyzer = Analyzer(game)
         counts = analyzer.rolled_event()
         self.assertIsInstance(counts, pd.DataFrame)
+
+    def test_rolled_event_per_roll(self):
+        test_faces = np.array(['a', 'b', 'c', 'd'])
+        game = Game([Die(test_faces) for _ in range(3)])
+        game.play(50, seed=1)
+        analyzer = Analyzer(game)
+        counts = analyzer.rolled_event()
+        self.assertEqual(counts.shape, (50, 4))
+        self.assertEqual(list(counts.columns), ['a', 'b', 'c', 'd'])
+        self.assertTrue((counts.sum(axis=1) == 3).all())
+        first = game.play_results().iloc[0].value_counts()
+        self.assertEqual(counts.iloc[0][first.index].tolist(), first.tolist())
+        sparse = analyzer.rolled_event(sparse=True)
+        self.assertEqual(sparse['counts'].sum(), 150)
+        self.assertEqual(sparse.loc[(0, first.index[0]), 'counts'], first.iloc[0])
         
     def test_permutation_count(self):
         test_faces = np.array([1, 2, 3, 4, 5, 6])
@@ -101,7 +305,375 @@ class TestAnalyzerMethods(unittest.TestCase):
         analyzer = Analyzer(game)
         perms = analyzer.distinct_permutations()
         self.assertIsInstance(perms, pd.DataFrame)
+
+    def test_permutation_faces(self):
+        test_faces = np.array([1, 11])
+        game = Game([Die(test_faces), Die(test_faces)])
+        game.play(200, seed=6)
+        perms = Analyzer(game).distinct_permutations()
+        self.assertEqual(list(perms.index.names), ['die_0', 'die_1'])
+        self.assertEqual(perms['counts'].sum(), 200)
+        expected = game.play_results().value_counts()
+        self.assertEqual(perms['counts'].to_dict(), expected.to_dict())
+
+    def test_streamed_stats(self):
+        test_faces = np.array([1, 2, 3, 4, 5, 6])
+        die1 = Die(test_faces)
+        die2 = Die(test_faces)
+        game = Game([die1, die2])
+        game.play(500, seed=4)
+        analyzer = Analyzer(game)
+        self.assertEqual(analyzer.jackpot(game.play_stream(500, chunk_size=64, seed=4)), analyzer.jackpot())
+        pd.testing.assert_frame_equal(analyzer.combo_faces(game.play_stream(500, chunk_size=64, seed=4)).sort_index(),
+                                      analyzer.combo_faces().sort_index())
+        pd.testing.assert_frame_equal(analyzer.distinct_permutations(game.play_stream(500, chunk_size=64, seed=4)).sort_index(),
+                                      analyzer.distinct_permutations().sort_index())
         
+    def test_estimate(self):
+        test_faces = np.array(['H', 'T'])
+        game = Game([Die(test_faces), Die(test_faces)])
+        analyzer = Analyzer(game)
+        run = analyzer.estimate(abs_tol=0.01, batch=1000, seed=1)
+        self.assertTrue(run['converged'])
+        self.assertEqual(run['rolls'] % 1000, 0)
+        self.assertAlmostEqual(run['jackpot']['estimate'], 0.5, delta=0.02)
+        self.assertAlmostEqual(run['faces'].loc['H', 'estimate'], 0.5, delta=0.02)
+        budget = analyzer.estimate(abs_tol=1e-6, batch=1000, max_rolls=2500, seed=1)
+        self.assertFalse(budget['converged'])
+        self.assertEqual(budget['rolls'], 2500)
+
+    def test_estimate_rare_jackpot(self):
+        analyzer = Analyzer(Game([Die(np.arange(6))] * 10, seed=1))
+        run = analyzer.estimate(rel_tol=0.05, batch=1000, max_rolls=5000, seed=1)
+        self.assertFalse(run['converged'])
+        self.assertEqual(run['rolls'], 5000)
+        self.assertEqual(run['jackpot']['estimate'], 0)
+        self.assertGreater(run['jackpot']['stderr'], 0)
+        with self.assertRaises(ValueError):
+            analyzer.estimate(rel_tol=0.05, max_rolls=0)
+        with self.assertRaises(ValueError):
+            analyzer.estimate(rel_tol=0.05, max_rolls=1000, batch=0)
+        with self.assertRaises(ValueError):
+            analyzer.estimate(rel_tol=0.05)
+
+    def test_estimate_zero_weight(self):
+        die = Die(np.array([1, 2, 3]))
+        die.change_weight(3, 0)
+        run = Analyzer(Game([die, die])).estimate(rel_tol=0.05, batch=1000, max_rolls=10 ** 6, seed=1)
+        self.assertTrue(run['converged'])
+        self.assertLess(run['rolls'], 10 ** 6)
+        self.assertEqual(run['faces'].loc[3, 'estimate'], 0)
+        self.assertEqual(run['faces'].loc[3, 'stderr'], 0)
+        apart = Analyzer(Game([Die(np.array([1, 2])), Die(np.array([3, 4]))]))
+        run = apart.estimate(rel_tol=0.05, batch=1000, max_rolls=10 ** 6, seed=1)
+        self.assertTrue(run['converged'])
+        self.assertEqual(run['jackpot']['stderr'], 0)
+
+    def test_incremental(self):
+        test_faces = np.array([1, 2, 3])
+        game = Game([Die(test_faces)] * 3)
+        game.play(100, seed=1)
+        analyzer = Analyzer(game, incremental=True)
+        analyzer.jackpot()
+        game.play(50, seed=2, append=True)
+        self.assertEqual(len(game.play_results()), 150)
+        plain = Analyzer(game)
+        self.assertEqual(analyzer.jackpot(), plain.jackpot())
+        self.assertEqual(analyzer._seen, 150)
+        pd.testing.assert_frame_equal(analyzer.combo_faces().sort_index(), plain.combo_faces().sort_index())
+        pd.testing.assert_frame_equal(analyzer.distinct_permutations().sort_index(), plain.distinct_permutations().sort_index())
+        pd.testing.assert_frame_equal(analyzer.rolled_event(), plain.rolled_event())
+        game.play(20, seed=3)
+        self.assertEqual(analyzer.jackpot(), plain.jackpot())
+        self.assertEqual(analyzer._seen, 20)
+        other = Game([Die(test_faces)] * 3)
+        other.play(10, seed=5)
+        other.play(40, seed=4)
+        analyzer.game = other
+        self.assertEqual(other._run, game._run)
+        self.assertEqual(analyzer.jackpot(), Analyzer(other).jackpot())
+        self.assertEqual(analyzer._seen, 40)
+
+    def test_incremental_no_rolls(self):
+        game = Game([Die(np.array([1, 2, 3]))] * 2)
+        game.play(0)
+        analyzer = Analyzer(game, incremental=True)
+        self.assertEqual(analyzer.rolled_event().shape, (0, 3))
+        game.play(5, append=True)
+        self.assertEqual(analyzer.rolled_event().shape, (5, 3))
+
+    def test_cache(self):
+        test_faces = np.array([1, 2, 3])
+        game = Game([Die(test_faces)] * 2)
+        game.play(100, seed=1)
+        analyzer = Analyzer(game, cache_size=2)
+        first = analyzer.combo_faces()
+        first.iloc[0, 0] = -1
+        self.assertNotEqual(analyzer.combo_faces().iloc[0, 0], -1)
+        self.assertEqual(analyzer.cache_info()['hits'], 1)
+        analyzer.jackpot()
+        analyzer.distinct_permutations()
+        self.assertEqual(analyzer.cache_info()['size'], 2)
+        game.play(100, seed=2)
+        self.assertEqual(analyzer.jackpot(), Analyzer(game).jackpot())
+        self.assertEqual(analyzer.cache_info(), {'hits': 1, 'misses': 4, 'size': 1, 'maxsize': 2})
+        analyzer.cache_clear()
+        self.assertEqual(analyzer.cache_info()['size'], 0)
+        other = Game([Die(test_faces)] * 2)
+        other.play(100, seed=3)
+        other.play(100, seed=4)
+        jackpot = analyzer.jackpot()
+        analyzer.game = other
+        self.assertEqual(other._version, game._version)
+        self.assertEqual(analyzer.jackpot(), Analyzer(other).jackpot())
+        self.assertNotEqual(analyzer.jackpot(), jackpot)
+
+    def test_summary(self):
+        test_faces = np.array(['a', 'b', 'c'])
+        game = Game([Die(test_faces)] * 3)
+        game.play(300, seed=5)
+        analyzer = Analyzer(game, cache_size=0)
+        summary = analyzer.summary()
+        self.assertEqual(summary['jackpot'], analyzer.jackpot())
+        pd.testing.assert_frame_equal(summary['rolled_event'], analyzer.rolled_event())
+        pd.testing.assert_frame_equal(summary['combo_faces'], analyzer.combo_faces())
+        pd.testing.assert_frame_equal(summary['distinct_permutations'], analyzer.distinct_permutations())
+        streamed = analyzer.summary(game.play_stream(300, chunk_size=64, seed=5))
+        pd.testing.assert_frame_equal(streamed['rolled_event'], analyzer.rolled_event(chunks=[game._data]))
+        pd.testing.assert_frame_equal(streamed['combo_faces'].sort_index(), summary['combo_faces'].sort_index())
+        game.play(0)
+        empty = analyzer.summary()
+        self.assertEqual(empty['jackpot'], 0)
+        self.assertEqual(len(empty['combo_faces']), 0)
+        self.assertEqual(empty['rolled_event'].shape, (0, 3))
+
+    def test_threads(self):
+        die = Die(np.array([1, 2, 3, 4]))
+        die.set_weights([4, 3, 2, 1])
+        game = Game([die] * 3)
+        game.play(150000, seed=6)
+        serial = Analyzer(game, cache_size=0)
+        threaded = Analyzer(game, cache_size=0, threads=3)
+        self.assertEqual(threaded.jackpot(), serial.jackpot())
+        pd.testing.assert_frame_equal(threaded.rolled_event(), serial.rolled_event())
+        pd.testing.assert_frame_equal(threaded.combo_faces(), serial.combo_faces())
+        pd.testing.assert_frame_equal(threaded.distinct_permutations(), serial.distinct_permutations())
+        summary = threaded.summary(game.play_stream(150000, seed=6))
+        pd.testing.assert_frame_equal(summary['combo_faces'], serial.combo_faces())
+
+class TestExactAnalyzerMethods(unittest.TestCase):
+    def test_exact_jackpot(self):
+        die1 = Die(np.array([1, 2, 3]))
+        die2 = Die(np.array([1, 2, 3]))
+        die2.change_weight(1, 2)
+        exact = ExactAnalyzer(Game([die1, die2]))
+        self.assertAlmostEqual(exact.jackpot(), (2 / 3 + 1 / 3 + 1 / 3) / 4)
+
+    def test_exact_combo_faces(self):
+        test_faces = np.array([1, 2, 3])
+        exact = ExactAnalyzer(Game([Die(test_faces), Die(test_faces)]))
+        combos = exact.combo_faces()
+        self.assertEqual(len(combos), 6)
+        self.assertAlmostEqual(combos['probability'].sum(), 1.0)
+        self.assertAlmostEqual(combos.loc[(1, 2), 'probability'], 2 / 9)
+        self.assertAlmostEqual(exact.combo_faces(900).loc[(3, 3), 'counts'], 100)
+
+    def test_exact_permutations(self):
+        die1 = Die(np.array([1, 2]))
+        die2 = Die(np.array([1, 2]))
+        die2.change_weight(2, 3)
+        perms = ExactAnalyzer(Game([die1, die2])).distinct_permutations()
+        self.assertEqual(list(perms.index.names), ['die_0', 'die_1'])
+        self.assertAlmostEqual(perms.loc[(1, 2), 'probability'], 0.375)
+
+    def test_exact_rolled_event(self):
+        test_faces = np.array([1, 2])
+        counts = ExactAnalyzer(Game([Die(test_faces)] * 2)).rolled_event()
+        self.assertEqual(counts[1].tolist(), [0.25, 0.5, 0.25])
+
+class TestStoreMethods(unittest.TestCase):
+    def test_save_and_open_results(self):
+        die = Die(np.array(['a', 'b', 'c']))
+        die.change_weight('a', 3)
+        game = Game([die, die, die])
+        game.play(100, seed=2)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'results.npy')
+            save_results(game, path)
+            stored = open_results(path)
+            self.assertIsInstance(stored._data, np.memmap)
+            pd.testing.assert_frame_equal(stored.play_results(), game.play_results())
+            self.assertEqual(stored.dies[0].current_state().loc['a', 'weights'], 3)
+            self.assertEqual(Analyzer(stored).jackpot(), Analyzer(game).jackpot())
+
+    def test_save_stream(self):
+        game = Game([Die(np.array([1, 2, 3, 4]))] * 2)
+        game.play(300, seed=7)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'stream.npy')
+            save_stream(game, path, 300, chunk_size=64, seed=7)
+            stored = open_results(path)
+            pd.testing.assert_frame_equal(Analyzer(stored).combo_faces(), Analyzer(game).combo_faces())
+
+    def test_header_replays_stored_play(self):
+        game = Game([Die(np.array([1, 2, 3, 4]))] * 2, seed=5)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'stream.npy')
+            save_stream(game, path, 100, chunk_size=32, seed=7)
+            stored = open_results(path)
+            (seed, rolls), = stored._plays
+            replay = Game([Die(np.array([1, 2, 3, 4]))] * 2)
+            replay.play(rolls, seed=seed)
+            np.testing.assert_array_equal(replay._data, stored._data)
+
+            game.play(10, seed=3)
+            game.play(5, append=True)
+            save_results(game, path)
+            stored = open_results(path)
+            replay = Game([Die(np.array([1, 2, 3, 4]))] * 2)
+            replay.play(stored._plays[0][1], seed=stored._plays[0][0])
+            replay.play(stored._plays[1][1], seed=stored._plays[1][0], append=True)
+            np.testing.assert_array_equal(replay._data, stored._data)
+
+@unittest.skipIf(columnar.pa is None, "pyarrow is not installed")
+class TestColumnarMethods(unittest.TestCase):
+    def test_results_round_trip(self):
+        game = Game([Die(np.array(['a', 'b', 'c']))] * 2)
+        game.play(200, seed=3)
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ['results.parquet', 'results.arrow']:
+                path = os.path.join(folder, name)
+                columnar.write_results(game, path, chunks=game.play_stream(200, chunk_size=64, seed=3))
+                frames = list(columnar.read_results(path))
+                self.assertEqual(len(frames), 4)
+                self.assertTrue(pd.concat(frames).equals(game.play_results()))
+                np.testing.assert_array_equal(np.concatenate(list(columnar.read_chunks(path))), game._data)
+
+    def test_dice_round_trip(self):
+        die = Die(np.array([1, 2, 3]))
+        die.change_weight(2, 4)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'dice.parquet')
+            columnar.write_dice([die, Die(np.array([1, 2]))], path)
+            dies = columnar.read_dice(path)
+            self.assertEqual(len(dies), 2)
+            self.assertEqual(dies[0].current_state().loc[2, 'weights'], 4)
+
+    def test_frame_round_trip(self):
+        game = Game([Die(np.array([1, 2, 3]))] * 2)
+        game.play(50)
+        combos = Analyzer(game).combo_faces()
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'combos.arrow')
+            columnar.write_frame(combos, path)
+            self.assertTrue(columnar.read_frame(path).equals(combos))
+            rolled = Analyzer(game).rolled_event()
+            path = os.path.join(folder, 'rolled.parquet')
+            columnar.write_frame(rolled, path)
+            self.assertTrue(columnar.read_frame(path).equals(rolled))
+
+    def test_stream_without_play(self):
+        game = Game([Die(np.array(['x', 'y']))] * 2)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'results.parquet')
+            columnar.write_results(game, path, chunks=game.play_stream(30, seed=4))
+            game.play(30, seed=4)
+            self.assertTrue(pd.concat(columnar.read_results(path)).equals(game.play_results()))
+
+class TestInstrumentMethods(unittest.TestCase):
+    def test_profile(self):
+        test_faces = np.array([1, 2, 3])
+        game = Game([Die(test_faces)] * 2)
+        with profile(memory=True) as stats:
+            game.play(1000)
+            game.play_results()
+            Analyzer(game).jackpot()
+        summary = stats.summary()
+        self.assertEqual(list(summary.index), ['Game.play', 'Game.play_results', 'Analyzer.jackpot'])
+        self.assertEqual(summary.loc['Game.play', 'rows'], 1000)
+        self.assertGreater(summary.loc['Game.play', 'bytes'], 0)
+        game.play(10)
+        self.assertEqual(len(stats.records), 3)
+
+    def test_hook(self):
+        records = []
+        add_hook(records.append)
+        try:
+            Die(np.array([1, 2, 3])).roll(5)
+        finally:
+            remove_hook(records.append)
+        self.assertEqual(records[0]['stage'], 'Die.roll')
+        self.assertEqual(records[0]['rows'], 5)
+        self.assertIsNone(records[0]['bytes'])
+
+    def test_analyzer_rows(self):
+        game = Game([Die(np.array([1, 2, 3]))] * 2)
+        game.play(100, seed=1)
+        analyzer = Analyzer(game)
+        records = []
+        add_hook(records.append)
+        try:
+            analyzer.rolled_event(False)
+            analyzer.rolled_event(False, game.play_stream(50, seed=2))
+            analyzer.rolled_event(chunks=game.play_stream(50, seed=2))
+        finally:
+            remove_hook(records.append)
+        self.assertEqual([record['rows'] for record in records], [100, None, None])
+
+class TestWordsMethods(unittest.TestCase):
+    def test_word_index(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'words.txt')
+            with open(path, 'w') as file:
+                file.write('AT\nTA\ncat\nABCDEFGHIJKLMNO\n')
+            index = WordIndex(path)
+        self.assertEqual(len(index), 4)
+        letters = np.array([[0, 19], [19, 19], [0, 255]], dtype=np.uint8)
+        self.assertEqual(index.contains(letters).tolist(), [True, False, False])
+        self.assertTrue(index.contains(np.arange(15, dtype=np.uint8)[None, :])[0])
+
+    def test_letter_die(self):
+        die = letter_die()
+        self.assertEqual(len(die.current_state()), 26)
+        self.assertEqual(die.current_state()['weights'].idxmax(), 'E')
+
+    def test_count_words(self):
+        die = Die(np.array(['A', 'T', 'X']))
+        die.change_weight('X', 0)
+        game = Game([die, die])
+        game.play(200, seed=1)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'words.txt')
+            with open(path, 'w') as file:
+                file.write('AT\nTA\n')
+            result = count_words(Analyzer(game), WordIndex(path))
+        results = game.play_results()
+        spelled = (results['die_0'] != results['die_1']).sum()
+        self.assertEqual(result['words'], 2)
+        self.assertEqual(result['rolls'], spelled)
+        self.assertEqual(result['permutations'], 4)
+
+
+class TestCliMethods(unittest.TestCase):
+    def test_cli(self):
+        stored, streamed = io.StringIO(), io.StringIO()
+        args = ['--faces', 'H', 'T', '--weights', '3', '1', '--rolls', '1000', '--seed', '5', '--workers', '1']
+        with contextlib.redirect_stdout(stored), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(cli.main(args + ['--stats', 'jackpot', 'combo_faces']), 0)
+        with contextlib.redirect_stdout(streamed), contextlib.redirect_stderr(io.StringIO()):
+            cli.main(args + ['--stats', 'jackpot', 'combo_faces', '--chunk-size', '300'])
+        game = Game([Die(np.array(['H', 'T']))] * 2)
+        game.dies[0].set_weights([3, 1])
+        game.play(1000, seed=5)
+        self.assertEqual(stored.getvalue().split('\n')[:3], ['# jackpot', 'jackpot', str(Analyzer(game).jackpot())])
+        self.assertEqual(stored.getvalue(), streamed.getvalue())
+
+    def test_cli_rejects_bad_arguments(self):
+        for bad in [['--rolls', '10', '--chunk-size', '-5'], ['--rolls', '10', '--chunk-size', '0'],
+                    ['--rolls', '10', '--weights-file', 'missing/weights.txt']]:
+            with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                cli.main(bad)
+
 if __name__ == '__main__':
 
-    unittest.main(verbosity=3)
\ No newline at end of file
+    unittest.main(verbosity=3)
@@ -9,5 +9,8 @@ setup(
     author_email='kzk8qq@virginia.edu',
     license='MIT',
     packages=['Demo'],
-    install_requires=['pandas', 'numpy','matplotlib']
+    package_data={'Demo': ['data/*.txt']},
+    install_requires=['pandas', 'numpy','matplotlib'],
+    extras_require={'arrow': ['pyarrow']},
+    entry_points={'console_scripts': ['montecarlo=Demo.cli:main']}
 )